@@ -20,11 +20,26 @@ import sys
 
 from fnmatch import fnmatch
 from html import escape
+from itertools import chain, groupby, islice
 from urllib.parse import quote_plus
 import argparse
+import atexit
+import csv
+import filecmp
+import glob
+import gzip
+import heapq
+import json
 import os, os.path
 import re
+import shutil
 import time
+import zlib
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 try:
     from config import VERSION, DATA_DIR, CLOSURE_BASE
@@ -50,7 +65,6 @@ from collections import defaultdict
 js_name_part = r'[a-zA-Z$_][0-9a-zA-Z$_]*'
 js_name = js_name_part + r'(?:\.' + js_name_part + ')*'
 
-all_comment_regex = re.compile(r'(/\*.*?\*/|//.*?$)', re.M|re.S)
 assign_regex = re.compile(
     r'(?:var\s+)?(' + js_name + r')\s*(?:=\s*(function|goog\.abstractMethod)?|;)')
 block_tag_regex = re.compile(
@@ -58,13 +72,21 @@ block_tag_regex = re.compile(
     + '|constructor|type|enum|private|extends|protected|suppress|const'
     + '|description|override|inheritdoc)', re.I)
 comment_cont_regex = re.compile(r'^\s*\*')
-comment_end_regex = re.compile(r'\*/')
-comment_start_regex = re.compile(r'/\*\*')
+enum_key_regex = re.compile(r'^[ \t]*(' + js_name_part + r')\s*:', re.M)
 extends_regex = re.compile(r'@extends\s*(\{\s*)?(?P<super>' + js_name + r')(?(1)\s*\})')
 function_regex = re.compile(r'function\s*(' + js_name_part + r')\s*\(')
+js_regexp_regex = re.compile(
+    r'/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/')
+js_special_regex = re.compile(r'[/\'"`]')
+js_string_regexes = {
+    "'": re.compile(r"'(?:[^'\\\n]|\\.)*'?", re.S),
+    '"': re.compile(r'"(?:[^"\\\n]|\\.)*"?', re.S),
+    '`': re.compile(r'`(?:[^`\\]|\\.)*`?', re.S),
+}
 leading_stars_regex = re.compile(r'^\s*\*+')
 prov_regex = re.compile(r'goog\.provide\s*\(\s*[\'\"]([^\)]+)[\'\"]\s*\)')
 req_regex = re.compile(r'goog\.require\s*\(\s*[\'\"]([^\)]+)[\'\"]\s*\)')
+sentence_end_regex = re.compile(r'(?<=[.!?:])\s')
 space_regex = re.compile(r' *')
 
 ######################################################################
@@ -100,26 +122,170 @@ def find_data_file(name):
     print('error: cannot find data file "%s"'%name, file=sys.stderr)
     raise SystemExit(1)
 
+def build_date():
+    """The date shown in the footer of the HTML pages.
+
+    For reproducible output, the date can be fixed by setting the
+    environment variable SOURCE_DATE_EPOCH to a UNIX timestamp.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        try:
+            return time.strftime("%Y-%m-%d", time.gmtime(int(epoch)))
+        except ValueError:
+            print('error: invalid SOURCE_DATE_EPOCH "%s", ignored' % epoch,
+                  file=sys.stderr)
+    return time.strftime("%Y-%m-%d")
+
 class BasicFile(object):
 
+    # records the compression level of the last complete run with --gzip
+    gzip_stamp = 'jvjsdoc-gzip-level'
+    gzip_outdated = False
+
     def __init__(self, fname):
         self.fname = fname
         self.basedir = os.path.dirname(fname)
 
     def write(self, contents):
         full = os.path.join(args.output_dir, self.fname)
+        data = contents.encode('utf-8')
+        if args.verbose:
+            print("writing %s ..." % full, end=' ', file=progress)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        changed = not self._has_contents(full, data)
+        if changed:
+            f = open(full, 'wb')
+            f.write(data)
+            f.close()
+        if args.gzip:
+            self._write_gzip(full, len(data), changed, data)
+        else:
+            self._remove_gzip(full)
+        if args.verbose:
+            print("done" if changed else "unchanged", file=progress)
+        return len(data)
+
+    def write_stream(self, chunks):
+        """Write the strings from the iterable `chunks` to the file.
+
+        In contrast to `write()`, the contents are never held in memory
+        all at once.  The data is written to a temporary file first,
+        which then replaces the output file if the contents changed.
+        """
+        full = os.path.join(args.output_dir, self.fname)
+        tmp = full + '.tmp'
         if args.verbose:
-            print("writing %s ..." % full, end=' ')
+            print("writing %s ..." % full, end=' ', file=progress)
         os.makedirs(os.path.dirname(full), exist_ok=True)
-        f = open(full, 'w')
-        f.write(contents)
+        f = open(tmp, 'wb')
+        size = 0
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            f.write(data)
+            size += len(data)
         f.close()
+        changed = (not os.path.exists(full)
+                   or not filecmp.cmp(tmp, full, shallow=False))
+        if changed:
+            os.replace(tmp, full)
+        else:
+            os.remove(tmp)
+        if args.gzip:
+            self._write_gzip(full, size, changed)
+        else:
+            self._remove_gzip(full)
         if args.verbose:
-            print("done")
+            print("done" if changed else "unchanged", file=progress)
+        return size
+
+    @staticmethod
+    def _has_contents(full, data):
+        """Check whether the file `full` already contains exactly `data`."""
+        try:
+            if os.path.getsize(full) != len(data):
+                return False
+            f = open(full, 'rb')
+            old = f.read()
+            f.close()
+        except OSError:
+            return False
+        return old == data
+
+    @staticmethod
+    def _remove_gzip(full):
+        """Remove a stale compressed copy of `full`, if there is one."""
+        gz_full = full + '.gz'
+        if os.path.exists(gz_full):
+            os.remove(gz_full)
+
+    @staticmethod
+    def _write_gzip(full, size, changed, data=None):
+        """Write a pre-compressed copy of `full` to `full` + '.gz'.
+
+        `size` is the length of the file and `data`, if given, its
+        contents; otherwise the contents are read back from `full`.
+        Files smaller than `args.gzip_min_size` get no compressed copy
+        (and stale copies from earlier runs are removed).  If the
+        uncompressed file was unchanged and the compressed copy is
+        newer than it and was written at the same compression level,
+        nothing is done.  The copy is written to a temporary file
+        first, so that an interrupted run leaves no truncated copy.
+        """
+        gz_full = full + '.gz'
+        if size < args.gzip_min_size:
+            BasicFile._remove_gzip(full)
+            return
+        if (not changed and not BasicFile.gzip_outdated
+                and os.path.exists(gz_full)
+                and os.path.getmtime(gz_full) >= os.path.getmtime(full)):
+            return
+        tmp = gz_full + '.tmp'
+        f = open(tmp, 'wb')
+        gz = gzip.GzipFile(filename='', mode='wb', fileobj=f,
+                           compresslevel=args.gzip_level, mtime=0)
+        if data is not None:
+            gz.write(data)
+        else:
+            src = open(full, 'rb')
+            shutil.copyfileobj(src, gz)
+            src.close()
+        gz.close()
+        f.close()
+        os.replace(tmp, gz_full)
+
+    @staticmethod
+    def start_gzip():
+        """Check whether existing compressed copies can be kept.
+
+        If the stamp file written by `finish_gzip()` is missing, or
+        gives a compression level different from `args.gzip_level`, all
+        compressed copies are rewritten.  The stamp is removed until
+        the run completes.
+        """
+        full = os.path.join(args.output_dir, BasicFile.gzip_stamp)
+        try:
+            f = open(full)
+            level = int(f.read())
+            f.close()
+            os.remove(full)
+        except (OSError, ValueError):
+            level = None
+        BasicFile.gzip_outdated = level != args.gzip_level
+
+    @staticmethod
+    def finish_gzip():
+        """Record the compression level, once all files are written."""
+        if args.gzip:
+            full = os.path.join(args.output_dir, BasicFile.gzip_stamp)
+            f = open(full, 'w')
+            f.write('%d\n' % args.gzip_level)
+            f.close()
 
 class BasicHtmlFile(BasicFile):
 
     template = None
+    date = None
 
     def __init__(self, fname):
         super().__init__(fname)
@@ -132,19 +298,29 @@ class BasicHtmlFile(BasicFile):
             BasicHtmlFile.template = open(fname).read()
         return BasicHtmlFile.template
 
-    def write(self, title, html_title, body):
+    def _format(self, tmpl, title, html_title, body=''):
         path = os.path.dirname(self.fname)
         def repl_fn(m):
             return os.path.relpath(m.group(1), path)
-        tmpl = re.sub('@<([^>]*)>', repl_fn, self._get_template())
-        text = tmpl.format(
+        tmpl = re.sub('@<([^>]*)>', repl_fn, tmpl)
+        return tmpl.format(
             title = title,
             HTMLtitle = html_title,
             breadcrumbs = '\n'.join('<li>' + x for x in self.breadcrumbs),
             body = body,
             version = VERSION,
-            date = time.strftime("%Y-%m-%d"))
-        super().write(text)
+            date = BasicHtmlFile.date)
+
+    def write(self, title, html_title, body):
+        text = self._format(self._get_template(), title, html_title, body)
+        return super().write(text)
+
+    def write_stream(self, title, html_title, body):
+        """Like `write()`, but `body` is an iterable of strings."""
+        head, tail = self._get_template().split('{body}', 1)
+        head = self._format(head, title, html_title)
+        tail = self._format(tail, title, html_title)
+        return super().write_stream(chain([ head ], body, [ tail ]))
 
 def split_leading_type_info(s, braces_optional=False):
     s = s.lstrip()
@@ -195,17 +371,16 @@ class HtmlFile(BasicHtmlFile):
             res.append(bit)
         return span('{' + ''.join(res) + '}', 'type')
 
-    def generate(self):
-        body = []
+    def _entries(self):
+        """Collect the symbols documented on this page.
 
+        Returns a tuple (mainsym, lineage, names, entries), where
+        `lineage` is the list of classes `mainsym` is derived from,
+        and `entries` maps the names from the list `names` to pairs
+        [sym, comment].
+        """
         mainsym = Symbol.get(self.symbols[0])
 
-        parts = mainsym.name.split('.')[:-1]
-        for k, part in enumerate(parts):
-            name = '.'.join(parts[:k+1])
-            crumb = href(Symbol.get(name).url(), part, self.basedir)
-            self.breadcrumbs.append(crumb)
-
         entries = {}
         sym = mainsym
         lineage = [ ]
@@ -239,13 +414,42 @@ class HtmlFile(BasicHtmlFile):
             names = [ mainsym.name ] + names
             entries[mainsym.name] = [ mainsym, '' ]
 
+        return mainsym, lineage, names, entries
+
+    def generate(self):
+        if cost_report is not None:
+            start = time.perf_counter_ns()
+
+        mainsym = Symbol.get(self.symbols[0])
+
+        parts = mainsym.name.split('.')[:-1]
+        for k, part in enumerate(parts):
+            name = '.'.join(parts[:k+1])
+            crumb = href(Symbol.get(name).url(), part, self.basedir)
+            self.breadcrumbs.append(crumb)
+
+        title = mainsym.title()
+        html_title = mainsym.title(as_html=True)
+        if args.low_memory:
+            size = self.write_stream(title, html_title, self._body())
+        else:
+            size = self.write(title, html_title, ''.join(self._body()))
+
+        if cost_report is not None:
+            cost_report.add('page', self.fname, time.perf_counter_ns() - start,
+                            size, len(self.symbols))
+
+    def _body(self):
+        """Generate the HTML for the page body, as a sequence of strings."""
+        mainsym, lineage, names, entries = self._entries()
+
         if len(lineage) > 1:
             lines = []
             for sym in lineage:
                 url = sym.url() if sym != mainsym else None
                 lines.append(href(url, code(sym.name), self.basedir))
-            body.append('<p class="lineage">' + '<br>\n&gt; '.join(lines)
-                        + '\n')
+            yield ('<p class="lineage">' + '<br>\n&gt; '.join(lines)
+                   + '\n')
 
         for name in names:
             sym, comment = entries[name]
@@ -265,20 +469,20 @@ class HtmlFile(BasicHtmlFile):
                 state = sym.state()
                 title = sym.prototype(as_html=True, name=name)
                 if state in [ "protected", "deprecated" ]:
-                    body.append('<div class="hidden">')
+                    yield '<div class="hidden">'
                     has_div = True
                     title += ' [%s]' % state
             sym_type = sym.get_tag('type')
             if sym_type:
                 sym_type, _ = split_leading_type_info(sym_type, True)
                 title += ' ' + self.format_type_info(sym_type)
-            body.append(h2(title, sym.name.rsplit('.',1)[-1]) + '\n')
+            yield h2(title, sym.name.rsplit('.',1)[-1]) + '\n'
 
             deprecated = sym.deprecated()
             if deprecated:
-                body.append('<p><b>Deprecated.</b> '+deprecated+'\n')
+                yield '<p><b>Deprecated.</b> '+deprecated+'\n'
             if comment:
-                body.append('<p>'+comment+'\n')
+                yield '<p>'+comment+'\n'
 
             par = []
             desc = sym.description()
@@ -287,7 +491,7 @@ class HtmlFile(BasicHtmlFile):
             if link:
                 par.append(href(link, '&hellip;&nbsp;more', self.basedir))
             if par:
-                body.append('<p>' + ''.join(x+'\n' for x in par))
+                yield '<p>' + ''.join(x+'\n' for x in par)
             if link:
                 continue
 
@@ -298,15 +502,13 @@ class HtmlFile(BasicHtmlFile):
                     interface.append((code(name) + ' ' +
                                       self.format_type_info(tp),
                                       desc))
-            parts = sym._jsdoc_parts()
-            for tp, cont in parts:
-                if tp != "return":
-                    continue
-                tp, desc = split_leading_type_info(cont)
+            returns = sym.returns()
+            if returns:
+                tp, desc = returns
                 interface.append(('returns ' +
                                   self.format_type_info(tp),
                                   desc))
-                break
+            parts = sym._jsdoc_parts()
             for tp, cont in parts:
                 if tp in [ 'constructor', 'deprecated', 'description',
                            'extends', 'inheritdoc', 'interface', 'override',
@@ -314,11 +516,11 @@ class HtmlFile(BasicHtmlFile):
                     continue
                 interface.append(('@'+tp, escape(cont)))
             if interface:
-                body.append('<dl>\n')
+                yield '<dl>\n'
                 for key, val in interface:
-                    body.append('<dt>'+key+'\n')
-                    body.append('<dd>'+val+'\n')
-                body.append('</dl>\n\n')
+                    yield '<dt>'+key+'\n'
+                    yield '<dd>'+val+'\n'
+                yield '</dl>\n\n'
 
             rest = []
             for key, val in sym.data.items():
@@ -330,22 +532,48 @@ class HtmlFile(BasicHtmlFile):
                     continue
                 rest.append((key,val))
             if rest:
-                body.append('<p>unhandled information:\n')
-                body.append('<dl>\n')
+                yield '<p>unhandled information:\n'
+                yield '<dl>\n'
                 for key,val in rest:
-                    body.append('<dt>%s\n'%code(key))
-                    body.append('<dd>%s\n'%code(repr(val)))
-                body.append('</dl>\n')
+                    yield '<dt>%s\n'%code(key)
+                    yield '<dd>%s\n'%code(repr(val))
+                yield '</dl>\n'
             if has_div:
-                body.append('</div>\n')
-        self.write(mainsym.title(), mainsym.title(as_html=True), ''.join(body))
+                yield '</div>\n'
 
 ######################################################################
 # keep track of all known symbol names
 
+class DocStore(object):
+
+    """Compressed storage for the JsDoc comments of all symbols.
+
+    This is used instead of `Symbol.data['doc']` in low-memory mode.
+    """
+
+    def __init__(self):
+        self.docs = {}
+
+    def add(self, name, doc):
+        self.docs[name] = zlib.compress(doc.encode('utf-8'))
+
+    def get(self, name):
+        data = self.docs.get(name)
+        return zlib.decompress(data).decode('utf-8') if data else ''
+
+    def release(self, name):
+        self.docs.pop(name, None)
+
 class Symbol(object):
 
     all_names = {}
+    doc_store = None
+
+    # lookup tables, filled in by `Symbol.freeze()`
+    filenames = {}
+    urls = {}
+    pages = {}
+    public_names = []
 
     @staticmethod
     def get(name, no_create=False):
@@ -355,6 +583,45 @@ class Symbol(object):
             return None
         return Symbol(name)
 
+    @staticmethod
+    def freeze():
+        """Compute the file names, URLs and HTML pages of all symbols.
+
+        This is called once all symbols have been extracted.  Afterwards
+        `filename()` and `url()` look up their results in the tables
+        `Symbol.filenames` and `Symbol.urls`.  `Symbol.pages` maps the
+        file name of every HTML page to the list of symbols shown on it,
+        starting with the symbol the page belongs to, and
+        `Symbol.public_names` lists the symbols for the index, in the
+        order given by `index_key()`.  Symbols created later are not
+        included in these tables.
+        """
+        names = sorted(Symbol.all_names.keys())
+        filenames = {}
+        for name in names:
+            filenames[name] = Symbol.all_names[name]._find_filename()
+        urls = {}
+        pages = {}
+        for name in names:
+            fname = filenames[name]
+            url = fname
+            if fname:
+                pages.setdefault(fname, []).append(name)
+            if '.' in name:
+                parent_name, tail = name.rsplit('.', 1)
+                parent_fname = filenames[parent_name]
+                if parent_fname:
+                    pages.setdefault(parent_fname, []).append(name)
+                    if not fname:
+                        url = parent_fname + '#' + quote_plus(tail)
+            urls[name] = url
+        Symbol.filenames = filenames
+        Symbol.urls = urls
+        Symbol.pages = pages
+        Symbol.public_names = [
+            name for name in sorted(names, key=index_key)
+            if urls[name] and not Symbol.all_names[name].is_private() ]
+
     def __init__(self, name):
         self.name = name
         self.children = []
@@ -362,6 +629,8 @@ class Symbol(object):
         self.data = {}
         self._doc = None
         self._doc_parts = None
+        self._summary = None
+        self._released = False
 
         self.all_names[name] = self
 
@@ -403,9 +672,37 @@ class Symbol(object):
                 return sym
         return None
 
+    def doc(self):
+        """The JsDoc comment for the symbol."""
+        if Symbol.doc_store is not None:
+            return Symbol.doc_store.get(self.name)
+        return self.data.get('doc', '')
+
+    def uses_super_doc(self):
+        """Check whether the documentation refers to the superclass."""
+        doc = self.doc().lower()
+        return '@inheritdoc' in doc or '@override' in doc
+
+    def release_doc(self):
+        """Free the documentation once no more pages need it.
+        Only the summary of public symbols is kept, for the index.
+        Afterwards the comment is never parsed again, since this
+        would replace the summary by an empty string.
+        """
+        if self._summary is None and not self.is_private():
+            self._jsdoc_parts()
+        self._doc_parts = None
+        self._released = True
+        if Symbol.doc_store is not None:
+            Symbol.doc_store.release(self.name)
+        else:
+            self.data.pop('doc', None)
+
     def _jsdoc_parts(self):
+        if self._released:
+            return []
         if not self._doc_parts:
-            doc = self.data.get('doc', '').lstrip()
+            doc = self.doc().lstrip()
             if not doc.startswith('@'):
                 doc = '@description\n' + doc
             blocks = block_tag_regex.split(doc)[1:]
@@ -413,7 +710,7 @@ class Symbol(object):
             has_inherit_doc = False
             has_override = False
             for block in blocks:
-                part = re.split(r'\b\s*', block, 1) + [ '' ]
+                part = re.split(r'(?<=\w)\b\s*', block, maxsplit=1) + [ '' ]
                 key = part[0].lower()
                 parts.append((key, part[1]))
                 if key == 'inheritdoc':
@@ -438,6 +735,13 @@ class Symbol(object):
                     tmpl = "error: %s uses '@override' but no superclass found"
                     print(tmpl%self.name, file=sys.stderr)
             self._doc_parts = parts
+            desc = ''
+            for key, val in parts:
+                if key == 'description':
+                    desc = val.strip()
+                    break
+            if self._summary is None:
+                self._summary = sentence_end_regex.split(desc, 1)[0]
         return self._doc_parts
 
     def get_tag(self, key, default=None):
@@ -462,6 +766,12 @@ class Symbol(object):
     def description(self, doc=None):
         return self.get_tag('description', '').strip()
 
+    def summary(self):
+        """The first sentence of the description."""
+        if self._summary is None:
+            self._jsdoc_parts()
+        return self._summary
+
     def deprecated(self):
         return self.get_tag('deprecated')
 
@@ -482,6 +792,15 @@ class Symbol(object):
                 print("       " + cont, file=sys.stderr)
         return params
 
+    def returns(self):
+        """The type and description given by the '@return' JsDoc tag.
+        Returns a tuple (type, desc), or `None` if there is no such tag.
+        """
+        cont = self.get_tag('return')
+        if cont is None:
+            return None
+        return split_leading_type_info(cont)
+
     def prototype(self, as_html=False, max_column=75, name=None, doc=None):
         name = self.name if name is None else name
         if self.data.get('is_func', False):
@@ -536,15 +855,56 @@ class Symbol(object):
         else:
             return '%s'%name
 
+    def kind(self):
+        """A short string describing what kind of object the symbol is."""
+        if self.type():
+            return self.type()
+        elif self.data.get('is_func', False):
+            return 'function'
+        elif self.children or not self.data:
+            return 'namespace'
+        else:
+            return 'property'
+
+    def record(self):
+        """A dictionary with the extracted information about the symbol.
+        This is used for the machine-readable output of `--emit-json`.
+        """
+        res = {
+            'name': self.name,
+            'kind': self.kind(),
+            'url': self.url(),
+            'provided_by': self.provided_by,
+            'super': self.data.get('super'),
+            'private': self.is_private(),
+            'deprecated': self.deprecated(),
+            }
+        if self.data.get('is_func', False):
+            res['params'] = [ { 'name': name, 'type': tp, 'desc': desc }
+                              for name, tp, desc in self.params() ]
+            returns = self.returns()
+            if returns:
+                res['return'] = { 'type': returns[0], 'desc': returns[1] }
+            else:
+                res['return'] = None
+        return res
+
     def has_file(self):
         return self.children or self.type() in [ 'class', 'interface' ]
 
     def filename(self):
+        if self.name in Symbol.filenames:
+            return Symbol.filenames[self.name]
+        return self._find_filename()
+
+    def _find_filename(self):
         if not self.has_file():
             return None
         return os.path.join(*self.name.split('.')) + '.html'
 
     def url(self):
+        if self.name in Symbol.urls:
+            return Symbol.urls[self.name]
         path  = self.filename()
         extra = ''
         if not path:
@@ -556,6 +916,109 @@ class Symbol(object):
             return None
         return path + extra
 
+######################################################################
+# lexical analysis of javascript source
+
+# keywords after which a '/' starts a regular expression literal
+js_regexp_keywords = set([ 'case', 'delete', 'do', 'else', 'in',
+                           'instanceof', 'new', 'return', 'throw',
+                           'typeof', 'void', 'yield' ])
+
+def _regexp_allowed(prev):
+    """Check whether a '/' after the code `prev` starts a regexp literal.
+
+    `prev` is either the last non-space character of the preceding
+    code, or the last word if this ends in a letter or digit.
+    """
+    if not prev:
+        return True
+    c = prev[-1]
+    if c.isalnum() or c in '_$':
+        return prev in js_regexp_keywords
+    return c not in ')]}'
+
+def _last_token(chunk):
+    chunk = chunk.rstrip()
+    pos = len(chunk)
+    while pos > 0 and (chunk[pos-1].isalnum() or chunk[pos-1] in '_$'):
+        pos -= 1
+    return chunk[pos:] if pos < len(chunk) else chunk[-1:]
+
+def scan_source(text):
+    """Separate javascript source code from its comments.
+
+    String and regular expression literals are recognised, so that
+    comment delimiters inside literals are not mistaken for comments.
+    The running time is linear in the length of `text`.
+
+    Returns a tuple (code, docs, unclosed), where `code` is the source
+    with all comments removed and `docs` is a list of pairs (comment,
+    part), one for every JsDoc comment.  Here `comment` is the text
+    between the '/**' and '*/' delimiters and `part` is the code
+    following the comment, up to the next JsDoc comment.  `unclosed`
+    is true if the source ends inside a JsDoc comment.
+    """
+    chunks = []
+    length = 0
+    marks = []
+    unclosed = False
+    prev = ''
+    no_regexp_before = 0
+    pos = 0
+    end = len(text)
+    while pos < end:
+        m = js_special_regex.search(text, pos)
+        start = m.start() if m else end
+        if start > pos:
+            chunk = text[pos:start]
+            chunks.append(chunk)
+            length += len(chunk)
+            if not chunk.isspace():
+                prev = _last_token(chunk)
+        if not m:
+            break
+        c = text[start]
+        if c == '/' and text.startswith('/*', start):
+            close = text.find('*/', start+2)
+            is_doc = (text.startswith('/**', start)
+                      and not text.startswith('/**/', start))
+            if close < 0:
+                unclosed = is_doc
+                break
+            if is_doc:
+                marks.append((text[start+3:close], length))
+            pos = close + 2
+            continue
+        elif c == '/' and text.startswith('//', start):
+            close = text.find('\n', start)
+            pos = end if close < 0 else close
+            continue
+        elif c == '/':
+            token = '/'
+            if start >= no_regexp_before and _regexp_allowed(prev):
+                m = js_regexp_regex.match(text, start)
+                if m:
+                    token = m.group()
+                else:
+                    # Don't try again on the same line, to guarantee
+                    # linear running time.
+                    eol = text.find('\n', start)
+                    no_regexp_before = end if eol < 0 else eol
+            prev = ')' if len(token) > 1 else token
+        else:
+            token = js_string_regexes[c].match(text, start).group()
+            prev = ')'
+        chunks.append(token)
+        length += len(token)
+        pos = start + len(token)
+
+    code = ''.join(chunks)
+    docs = []
+    for k, (comment, start) in enumerate(marks):
+        stop = marks[k+1][1] if k+1 < len(marks) else len(code)
+        docs.append((comment, code[start:stop]))
+    return code, docs, unclosed
+
 ######################################################################
 # classes to represent files, classes, enums, ...
 
@@ -563,7 +1026,9 @@ class JsFile(object):
 
     def __init__(self, fname):
         self.fname = fname
+        self.provides = set()
         self.requires = set()
+        self.extends = set()
         self.fileoverview = None
         self.license = None
         self.symbols = []
@@ -585,7 +1050,7 @@ class JsFile(object):
         return '\n'.join(lines)
 
     @staticmethod
-    def from_source(fname):
+    def _read(fname):
         try:
             fd = open(fname)
             body = fd.read().expandtabs()
@@ -593,38 +1058,76 @@ class JsFile(object):
         except:
             print("error: cannot read " + fname, file=sys.stderr)
             return None
+        return body
+
+    @staticmethod
+    def from_source(fname, deps_only=False):
+        """Read the javascript file `fname`.
 
+        If `deps_only` is true, only the goog.provide/goog.require
+        statements and the '@extends' tags are extracted; the JsDoc
+        comments can be read later using `load_symbols()`.
+        """
+        if cost_report is not None:
+            start = time.perf_counter_ns()
+        body = JsFile._read(fname)
+        if body is None:
+            return None
         jsfile = JsFile(fname)
+        code, docs, unclosed = scan_source(body)
+        jsfile._scan_deps(code, docs)
+        if not deps_only:
+            jsfile._scan_symbols(docs, unclosed)
+        if cost_report is not None:
+            cost_report.add('file', fname, time.perf_counter_ns() - start,
+                            len(body), len(jsfile.symbols))
+        return jsfile
+
+    def load_symbols(self):
+        """Extract the JsDoc comments of a file read with `deps_only`."""
+        if cost_report is not None:
+            start = time.perf_counter_ns()
+        body = self._read(self.fname)
+        if body is not None:
+            _, docs, unclosed = scan_source(body)
+            self._scan_symbols(docs, unclosed)
+        if cost_report is not None:
+            cost_report.add('file', self.fname, time.perf_counter_ns() - start,
+                            0, len(self.symbols))
+
+    def _scan_deps(self, code, docs):
+        for comment, _ in docs:
+            for m in extends_regex.finditer(comment):
+                self.extends.add(m.group('super'))
 
-        code = all_comment_regex.sub('', body)
         for m in req_regex.finditer(code):
             name = m.group(1)
-            jsfile.requires.add(name)
+            self.requires.add(name)
         for m in prov_regex.finditer(code):
             name = m.group(1)
+            self.provides.add(name)
             sym = Symbol.get(name)
             if sym.provided_by:
                 tmpl = "%s alread provided by %s,"
                 print(tmpl % (name,sym.provided_by), file=sys.stderr)
-                print("  ignoring second provision in "+fname, file=sys.stderr)
+                print("  ignoring second provision in "+self.fname,
+                      file=sys.stderr)
             else:
-                sym.provided_by = fname
+                sym.provided_by = self.fname
 
-        parse_enum = False
-        for part in comment_start_regex.split("START\n"+body+"\nEND")[1:]:
-            try:
-                comment, part = comment_end_regex.split(part, 1)
-            except:
-                tmpl = "error: %s: unclosed comment, ignored"
-                print(tmpl%fname, file=sys.stderr)
-                continue
+    def _scan_symbols(self, docs, unclosed):
+        if unclosed:
+            tmpl = "error: %s: unclosed comment, ignored"
+            print(tmpl%self.fname, file=sys.stderr)
 
-            comment = jsfile.strip_comment(comment)
+        parse_enum = False
+        for comment, part in docs:
+            comment = self.strip_comment(comment)
             if "@fileoverview" in comment:
-                jsfile.fileoverview = comment
+                self.fileoverview = comment
                 continue
             if "@license" in comment:
-                jsfile.license = comment
+                self.license = comment
                 continue
             if "@enum" in comment:
                 if '{' in part:
@@ -632,19 +1135,19 @@ class JsFile(object):
                     bracket_level = 0;
                     enum_name = None
 
-            part = all_comment_regex.sub('', part).lstrip()
+            part = part.lstrip()
 
             m = assign_regex.match(part)
             if m:
                 name = m.group(1)
                 is_func = (m.group(2) != None)
-                jsfile.symbols.append((name, is_func, comment))
+                self.symbols.append((name, is_func, comment))
                 if parse_enum:
                     enum_name = name
             else:
                 m = function_regex.match(part)
                 if m:
-                    jsfile.symbols.append((m.group(1), True, comment))
+                    self.symbols.append((m.group(1), True, comment))
                     continue
 
             if parse_enum:
@@ -661,13 +1164,11 @@ class JsFile(object):
                             parse_enum = False
                             end = k
                             break
-                names = re.findall('^\s*(' + js_name_part + ')\s*:',
-                                   part[start:end],
-                                   re.M)
+                names = enum_key_regex.findall(part[start:end])
                 c = comment if "@enum" not in comment else ''
                 for name in names:
                     if enum_name:
-                        jsfile.symbols.append((enum_name + '.' + name, False,
+                        self.symbols.append((enum_name + '.' + name, False,
                                                c))
                     c = ''
 
@@ -677,15 +1178,15 @@ class JsFile(object):
         if parse_enum:
             print("error: cannot find end of enum %s" % enum_name,
                   file=sys.stderr)
-        return jsfile
 
     def extract_data(self):
         current_class = None
         for name, is_func, comment in self.symbols:
             data = {
                 'is_func': is_func,
-                'doc': comment,
                 }
+            if Symbol.doc_store is None:
+                data['doc'] = comment
             data['is_private'] = '@private' in comment
             if '.prototype.' in name:
                 name = name.replace('.prototype.', '.', 1)
@@ -719,18 +1220,23 @@ class JsFile(object):
                 print("error: multiple definitions for %s" % name,
                       file=sys.stderr)
                 if sym.provided_by:
-                    print("  using definition from " + sym.provided_by)
-                print("  ignoring definition in " + f, file=sys.stderr)
+                    print("  using definition from " + sym.provided_by,
+                          file=sys.stderr)
+                print("  ignoring definition in " + self.fname,
+                      file=sys.stderr)
                 continue
             sym.data = data
+            if Symbol.doc_store is not None:
+                Symbol.doc_store.add(name, comment)
 
 
-def read_files(root, res=None, verbose=False):
+def read_files(root, res=None, verbose=False, deps_only=False):
     """Read all javascript files from the directory tree at 'root'.
 
     This function recursively traverses the directory tree and reads
     all files with names ending in ".js".  For each file, all JsDoc
-    comments are extracted and stored in a `JsFile` object.
+    comments are extracted and stored in a `JsFile` object.  If
+    `deps_only` is true, only the dependency information is extracted.
 
     The function returns a dictionary, mapping file names to JsDoc
     objects.
@@ -738,24 +1244,46 @@ def read_files(root, res=None, verbose=False):
     if res is None:
         res = {}
     for path, dirs, files in os.walk(root):
-        for name in files:
+        dirs.sort()
+        for name in sorted(files):
             if not fnmatch(name, "*.js"):
                 continue
             full = os.path.join(path, name)
             if verbose:
                 print("scanning %s ..."%full, end=' ')
-            jsfile = JsFile.from_source(full)
+            jsfile = JsFile.from_source(full, deps_only)
             if jsfile is not None:
                 res[full] = jsfile
-                if verbose:
+                if verbose and deps_only:
+                    print("ok")
+                elif verbose:
                     print("ok, %s symbols"%len(jsfile.symbols))
             elif verbose:
                 print("error")
     return res
 
-def sort_files(tree):
-    """Sort the javascript source files in dependency order."""
-    sorted_files = []
+def find_provider(name):
+    """Find the file which provides the symbol `name`.
+
+    If `name` itself is not provided by any file, the file providing
+    the longest enclosing namespace is returned.  If no such file
+    exists, `None` is returned.
+    """
+    parts = name.split('.')
+    for k in range(len(parts), 0, -1):
+        sym = Symbol.get('.'.join(parts[:k]), True)
+        if sym and sym.provided_by:
+            return sym.provided_by
+    return None
+
+def file_dependencies(tree, with_extends=False):
+    """Find the dependencies between the javascript source files.
+
+    The function returns a dictionary, mapping each file name to the
+    set of files providing the symbols required by it.  If
+    `with_extends` is true, the files providing the superclasses
+    given in '@extends' tags are included, too.
+    """
     dependencies = {}
     for f, jsfile in tree.items():
         d = set()
@@ -763,12 +1291,70 @@ def sort_files(tree):
             g = Symbol.get(x).provided_by
             if g is not None and g != f:
                 d.add(g)
+        if with_extends:
+            for x in jsfile.extends:
+                g = find_provider(x)
+                if g is not None and g != f:
+                    d.add(g)
         dependencies[f] = d
+    return dependencies
+
+def select_files(tree, namespaces):
+    """Find the files needed to document the given namespaces.
+
+    This returns the set of all files which provide symbols inside
+    one of the `namespaces`, together with all files these depend on,
+    directly or indirectly.  If no file provides anything for one of
+    the `namespaces`, an error is reported and the program exits.
+    """
+    todo = set()
+    found = set()
+    for f, jsfile in tree.items():
+        for name in jsfile.provides:
+            for ns in namespaces:
+                if in_namespaces(name, [ ns ]):
+                    todo.add(f)
+                    found.add(ns)
+    for ns in namespaces:
+        f = find_provider(ns)
+        if f is not None:
+            todo.add(f)
+            found.add(ns)
+    missing = [ ns for ns in namespaces if ns not in found ]
+    for ns in missing:
+        print("error: no file provides the namespace %s" % ns,
+              file=sys.stderr)
+    if missing:
+        raise SystemExit(1)
+    dependencies = file_dependencies(tree, with_extends=True)
+    selected = set()
+    while todo:
+        f = todo.pop()
+        selected.add(f)
+        todo |= dependencies[f] - selected
+    return selected
+
+def in_namespaces(name, namespaces):
+    """Check whether the symbol `name` is inside one of the `namespaces`.
+
+    If `namespaces` is empty or `None`, all names are accepted.
+    """
+    if not namespaces:
+        return True
+    for ns in namespaces:
+        if name == ns or name.startswith(ns + '.'):
+            return True
+    return False
+
+def sort_files(tree):
+    """Sort the javascript source files in dependency order."""
+    sorted_files = []
+    dependencies = file_dependencies(tree)
     all_files = set(dependencies.keys())
     done = set()
     while len(done) < len(all_files):
         maybe_loop = True
-        todo = all_files - done
+        todo = sorted(all_files - done)
         for f in todo:
             dependencies[f] -= done
             if not dependencies[f]:
@@ -787,7 +1373,319 @@ def sort_files(tree):
             sorted_files.append(best_f)
             done.add(best_f)
     return sorted_files
+
+def write_json(fname, namespaces=None):
+    """Write one JSON record per symbol to the file `fname`.
+
+    The output is in "newline delimited JSON" format, every line is
+    the `Symbol.record()` of one symbol.  If `fname` is '-', the
+    records are written to stdout.  If `namespaces` is given, only
+    symbols inside these namespaces are included.
+    """
+    if fname == '-':
+        f = sys.stdout
+    else:
+        f = open(fname, 'w', encoding='utf-8')
+    for name in sorted(Symbol.all_names.keys()):
+        if not in_namespaces(name, namespaces):
+            continue
+        sym = Symbol.get(name)
+        f.write(json.dumps(sym.record(), sort_keys=True) + '\n')
+    if f is not sys.stdout:
+        f.close()
+
+def plan_doc_release(pages):
+    """Find out when the documentation of each symbol can be freed.
+
+    The argument is the list of HTML files, in the order they will be
+    generated.  The function returns a list which, for each page,
+    gives the symbols which are not needed for any later page.
+    """
+    last_use = {}
+    for k, fname in enumerate(pages):
+        _, _, _, entries = HtmlFile.all_files[fname]._entries()
+        seen = set()
+        for sym, _ in entries.values():
+            while sym and sym not in seen:
+                seen.add(sym)
+                last_use[sym] = k
+                sym = sym.find_in_super() if sym.uses_super_doc() else None
+    release = [ [] for _ in pages ]
+    for sym, k in last_use.items():
+        release[k].append(sym)
+    return release
+
+def peak_memory():
+    """The peak memory usage of the process in bytes, or `None`."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on MacOS and in kilobytes elsewhere
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+def report_memory():
+    usage = peak_memory()
+    if usage is not None:
+        print("peak memory usage: %.1f MiB" % (usage / 2**20),
+              file=sys.stderr)
+
+def index_key(name):
+    """Sort key for the index, keeping each namespace together."""
+    return name.split('.')
+
+def index_entries(namespaces=None, pages=None):
+    """Generate the entries for the index pages.
+
+    This yields tuples (name, url, desc) for all public symbols, in
+    the order given by `index_key()`.  If `namespaces` is given, only
+    symbols inside these namespaces are included.  If `pages` is
+    given, only symbols whose URL points into one of these HTML files
+    are included.
+    """
+    for name in Symbol.public_names:
+        if not in_namespaces(name, namespaces):
+            continue
+        url = Symbol.urls[name]
+        if pages is not None and url.split('#', 1)[0] not in pages:
+            continue
+        sym = Symbol.all_names[name]
+        desc = sym.summary() or sym.type_description(as_html=True)
+        yield name, url, desc
+
+def write_index(entries, depth, max_entries):
+    """Write the index pages.
+
+    The entries, as generated by `index_entries()`, are split into one
+    page per namespace, using the first `depth` components of each
+    name.  Namespaces with more than `max_entries` entries are split
+    further, one name component at a time.  When a namespace is split,
+    its own entry and the symbols directly inside it stay on its page,
+    and only the sub-namespaces get pages of their own.  The entries
+    are read as a stream: only the symbols directly inside a split
+    namespace, and at most `max_entries` + 1 entries of each
+    namespace being considered for a split, are kept in memory, and
+    every page is written as soon as it is complete.  Finally,
+    "index.html" is written, with links to all index pages.  The
+    description of each link is taken from the entry for the namespace
+    itself, so that no symbol information is needed when merging
+    shards.
+    """
+    pages = []
+    def page_key(level):
+        return lambda entry: '.'.join(entry[0].split('.')[:level])
+    def write_page(key, group):
+        fname = 'index-%s.html' % key
+        key_desc = ''
+        body = []
+        body.append('<ul class="index">\n')
+        for name, url, desc in group:
+            if name == key:
+                key_desc = desc
+            if desc:
+                desc = " &mdash; " + desc
+            body.append('<li>' + href(url, code(name)) + desc + '\n')
+        body.append('</ul>\n')
+        title = 'Index of %s' % key
+        html_title = 'Index of %s' % code(key)
+        BasicHtmlFile(fname).write(title, html_title, ''.join(body))
+        pages.append((key, fname, key_desc, len(body) - 2))
+    def write_group(key, group, level):
+        if level >= depth:
+            head = list(islice(group, max_entries + 1))
+            if len(head) <= max_entries:
+                write_page(key, head)
+                return
+            group = chain(head, group)
+        slot = len(pages)
+        own = []
+        for subkey, sub in groupby(group, key=page_key(level+1)):
+            first = next(sub)
+            second = next(sub, None)
+            if second is not None or first[0] != subkey:
+                rest = chain([ first ], [ second ] if second else [], sub)
+                write_group(subkey, rest, level+1)
+            elif level > 0:
+                own.append(first)
+            else:
+                # a top-level symbol without a namespace around it
+                write_page(subkey, [ first ])
+        if own:
+            write_page(key, own)
+            pages.insert(slot, pages.pop())
+    write_group('', entries, 0)
+
+    body = []
+    body.append('<ul class="index">\n')
+    for key, fname, desc, count in pages:
+        desc = " &mdash; " + desc if desc else ''
+        body.append('<li>' + href(fname, code(key)) + desc +
+                    ' (%d)\n' % count)
+    body.append('</ul>\n')
+    BasicHtmlFile("index.html").write("Index", "Index", ''.join(body))
+
+def write_xref(entries):
+    """Write "index.js", mapping symbol names to URLs for the search box.
+
+    The entries are tuples (name, url, desc) as generated by
+    `index_entries()`.
+    """
+    body = []
+    body.append('var jvXRef = {\n')
+    for name, url, _ in entries:
+        body.append("  '%s': '%s',\n"%(name, url))
+    body.append('};\n')
+    BasicFile("index.js").write(''.join(body))
+
+def write_data_files():
+    """Copy "jsdoc.css" and "jsdoc.js" into the output directory."""
+    for name in [ "jsdoc.css", "jsdoc.js" ]:
+        fname = find_data_file(name)
+        BasicFile(name).write(open(fname).read())
+
+######################################################################
+# distributed builds
+
+shard_manifest_regex = re.compile(r'^jvjsdoc-shard-(\d+)-of-(\d+)\.json$')
+
+def shard_manifest_name(shard):
+    return 'jvjsdoc-shard-%d-of-%d.json' % shard
+
+def write_shard_manifest(shard, entries):
+    """Write the index entries for the pages of one shard.
+
+    The manifest contains one JSON list [name, url, desc] per line,
+    for all `entries`, which should be restricted to the pages of the
+    shard.  The manifests are used by `merge_shards()` to construct
+    the index.
+    """
+    full = os.path.join(args.output_dir, shard_manifest_name(shard))
+    os.makedirs(args.output_dir, exist_ok=True)
+    f = open(full, 'w', encoding='utf-8')
+    for entry in entries:
+        f.write(json.dumps(entry) + '\n')
+    f.close()
+
+def read_shard_manifest(full):
+    f = open(full, encoding='utf-8')
+    for line in f:
+        yield tuple(json.loads(line))
+    f.close()
+
+def merge_shards(shard_dirs):
+    """Combine the output of a sharded build.
+
+    The HTML pages from all `shard_dirs` are copied into the output
+    directory, and the index pages, "index.js" and the data files are
+    written using the shard manifests.
+    """
+    manifests = {}
+    count = None
+    for shard_dir in shard_dirs:
+        for full in glob.glob(os.path.join(shard_dir, 'jvjsdoc-shard-*')):
+            m = shard_manifest_regex.match(os.path.basename(full))
+            if not m:
+                continue
+            k, n = int(m.group(1)), int(m.group(2))
+            if count is not None and n != count:
+                print("error: %s does not belong to a build with %d shards"
+                      % (full, count), file=sys.stderr)
+                raise SystemExit(1)
+            count = n
+            if k in manifests:
+                print("error: shard %d/%d found twice" % (k, n),
+                      file=sys.stderr)
+                raise SystemExit(1)
+            manifests[k] = full
+    if count is None:
+        print("error: no shard manifests found", file=sys.stderr)
+        raise SystemExit(1)
+    missing = [ str(k) for k in range(1, count+1) if k not in manifests ]
+    if missing:
+        print("error: missing shards %s of %d" % (', '.join(missing), count),
+              file=sys.stderr)
+        raise SystemExit(1)
+
+    out = os.path.realpath(args.output_dir)
+    for shard_dir in shard_dirs:
+        if os.path.realpath(shard_dir) == out:
+            continue
+        for path, dirs, files in os.walk(shard_dir):
+            for name in files:
+                if (shard_manifest_regex.match(name)
+                        or name == BasicFile.gzip_stamp):
+                    continue
+                full = os.path.join(path, name)
+                dest = os.path.join(out, os.path.relpath(full, shard_dir))
+                if args.verbose:
+                    print("copying %s ..." % full, file=progress)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copyfile(full, dest)
+
+    def entries():
+        streams = [ read_shard_manifest(manifests[k])
+                    for k in range(1, count+1) ]
+        return heapq.merge(*streams, key=lambda entry: index_key(entry[0]))
+    write_index(entries(), args.index_depth, args.index_max_entries)
+    write_xref(entries())
+    write_data_files()
 
+######################################################################
+# performance reports
+
+class CostReport(object):
+
+    """Collect the time spent on each source file and HTML page.
+
+    While the report is disabled, the global variable `cost_report` is
+    `None` and no timing information is collected.
+    """
+
+    def __init__(self):
+        self.records = {}
+
+    def add(self, kind, name, ns, size, symbols):
+        """Record `ns` nanoseconds spent on the file `name`.
+
+        `kind` is either 'file' for a javascript source file or 'page'
+        for an HTML output page, `size` is the file size in bytes and
+        `symbols` is the number of symbols in the file.  If the same
+        file is recorded more than once, the times are added up.
+        """
+        key = (kind, name)
+        if key in self.records:
+            old_ns, old_size, old_symbols = self.records[key]
+            ns += old_ns
+            size = max(size, old_size)
+            symbols = max(symbols, old_symbols)
+        self.records[key] = (ns, size, symbols)
+
+    def print_slowest(self, n):
+        for kind, label in [ ('file', 'source files'), ('page', 'pages') ]:
+            rows = [ (ns, size, symbols, name)
+                     for (k, name), (ns, size, symbols) in self.records.items()
+                     if k == kind ]
+            if not rows:
+                continue
+            rows.sort(reverse=True)
+            print("slowest %s:" % label, file=sys.stderr)
+            for ns, size, symbols, name in rows[:n]:
+                print("  %9.2f ms %9d bytes %6d symbols  %s"
+                      % (ns / 1e6, size, symbols, name), file=sys.stderr)
+
+    def write_csv(self, fname):
+        f = open(fname, 'w', newline='')
+        out = csv.writer(f)
+        out.writerow([ 'kind', 'name', 'time_ms', 'bytes', 'symbols' ])
+        for (kind, name), (ns, size, symbols) in sorted(self.records.items()):
+            out.writerow([ kind, name, '%.3f' % (ns / 1e6), size, symbols ])
+        f.close()
+
+def report_costs():
+    if args.report_slowest:
+        cost_report.print_slowest(args.report_slowest)
+    if args.report_csv:
+        cost_report.write_csv(args.report_csv)
+
 ######################################################################
 # main program
 
@@ -812,8 +1710,97 @@ parser.add_argument(
     '-o', '--output-dir',
     metavar='ROOT',
     action='store',
-    required=True,
     help="output directory for the generated HTML documentation")
+parser.add_argument(
+    '--emit-json',
+    metavar='FILE',
+    action='store',
+    help="write the extracted symbol information to FILE, as"
+    + " newline delimited JSON ('-' for stdout)")
+parser.add_argument(
+    '--only',
+    metavar='NAMESPACE',
+    action='append',
+    help="only document the given namespace; the files it depends on are"
+    + " read, but no pages are generated for them (may be repeated)")
+def shard_spec(s):
+    m = re.match(r'^(\d+)/(\d+)$', s)
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        raise argparse.ArgumentTypeError(
+            "invalid shard '%s', use I/N with 1 <= I <= N" % s)
+    return int(m.group(1)), int(m.group(2))
+parser.add_argument(
+    '--shard',
+    metavar='I/N',
+    type=shard_spec,
+    action='store',
+    help="only generate the I-th of N parts of the HTML pages;"
+    + " use --merge to combine the parts")
+parser.add_argument(
+    '--merge',
+    action='store_true',
+    help="combine the output of a build using --shard; the DIR arguments"
+    + " are the output directories of the shards")
+parser.add_argument(
+    '--low-memory',
+    action='store_true',
+    help="reduce the memory usage, at the cost of some speed")
+def positive_int(s):
+    try:
+        n = int(s)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            "invalid value '%s', must be a positive integer" % s)
+    return n
+parser.add_argument(
+    '--report-slowest',
+    metavar='N',
+    type=positive_int,
+    action='store',
+    help="print the N source files and pages which took longest to process")
+parser.add_argument(
+    '--report-csv',
+    metavar='FILE',
+    action='store',
+    help="write the processing time for every source file and page to FILE,"
+    + " in CSV format")
+parser.add_argument(
+    '-z', '--gzip',
+    action='store_true',
+    help="also write pre-compressed .gz copies of the output files")
+parser.add_argument(
+    '--gzip-level',
+    metavar='N',
+    type=int,
+    choices=range(1, 10),
+    default=9,
+    action='store',
+    help="compression level for --gzip, from 1 to 9 (default: 9)")
+parser.add_argument(
+    '--gzip-min-size',
+    metavar='BYTES',
+    type=int,
+    default=1024,
+    action='store',
+    help="do not compress files smaller than this (default: 1024)")
+parser.add_argument(
+    '--index-depth',
+    metavar='N',
+    type=positive_int,
+    default=1,
+    action='store',
+    help="split the index into one page per namespace, using the first"
+    + " N components of each name (default: 1)")
+parser.add_argument(
+    '--index-max-entries',
+    metavar='N',
+    type=positive_int,
+    default=500,
+    action='store',
+    help="split index pages with more than N entries into one page per"
+    + " sub-namespace (default: 500)")
 parser.add_argument(
     'source_dirs',
     metavar='DIR',
@@ -823,75 +1810,113 @@ parser.add_argument(
     help="directories containing JavaScript source files")
 class args:
     closure = False
+    gzip = False
+    low_memory = False
 parser.parse_args(namespace=args)
+if args.output_dir is None and args.emit_json is None:
+    parser.error("at least one of --output-dir and --emit-json is required")
+if args.output_dir is None and (args.shard or args.merge):
+    parser.error("--shard and --merge require --output-dir")
+if args.merge and (args.report_slowest or args.report_csv):
+    parser.error("--report-slowest and --report-csv cannot be used with"
+                 + " --merge, which reads no source files")
+
+# with '--emit-json -', stdout only carries the JSON records
+progress = sys.stderr if args.emit_json == '-' else sys.stdout
+BasicHtmlFile.date = build_date()
+if args.output_dir is not None:
+    BasicFile.start_gzip()
+
+if args.merge:
+    merge_shards(args.source_dirs)
+    BasicFile.finish_gzip()
+    raise SystemExit(0)
 
 if args.closure:
     args.source_dirs = [ CLOSURE_BASE ] + args.source_dirs
 
+if args.low_memory or args.verbose:
+    atexit.register(report_memory)
+if args.report_slowest or args.report_csv:
+    cost_report = CostReport()
+    atexit.register(report_costs)
+else:
+    cost_report = None
+
 # read the javascript source files
+start = time.perf_counter()
+if args.low_memory:
+    Symbol.doc_store = DocStore()
 sources = {}
-for root in args.source_dirs:
-    read_files(root, sources)
+if args.only:
+    for root in args.source_dirs:
+        read_files(root, sources, deps_only=True)
+    needed = select_files(sources, args.only)
+    sources = { f: jsfile for f, jsfile in sources.items() if f in needed }
+    for jsfile in sources.values():
+        jsfile.load_symbols()
+else:
+    for root in args.source_dirs:
+        read_files(root, sources)
 sorted_files = sort_files(sources)
 for f in sorted_files:
     jsfile = sources[f]
     jsfile.extract_data()
+if args.verbose:
+    elapsed = time.perf_counter() - start
+    print("read %d files in %.2fs (%.1f files/s)"
+          % (len(sorted_files), elapsed, len(sorted_files) / elapsed),
+          file=sys.stderr)
+if args.low_memory:
+    # the comments are now kept in Symbol.doc_store
+    sources.clear()
+    jsfile = None
+Symbol.freeze()
+
+if args.emit_json:
+    write_json(args.emit_json, args.only)
+if args.output_dir is None:
+    raise SystemExit(0)
 
 # write HTML files for classes/name spaces
-for name in sorted(Symbol.all_names.keys()):
-    sym = Symbol.get(name)
-    fname = sym.filename()
-    if fname:
-        HtmlFile.get(fname).add_symbol(name)
-    parent = sym.parent()
-    if parent:
-        fname = parent.filename()
-        if fname:
-            HtmlFile.get(fname).add_symbol(name)
-
-for fname in sorted(HtmlFile.all_files.keys()):
-    html = HtmlFile.all_files[fname]
-    html.generate()
-
-# write index.html
-body = []
-body.append('<ul class="index">\n')
-for name in sorted(Symbol.all_names.keys()):
-    sym = Symbol.get(name)
-    if sym.is_private():
-        continue
-    url = sym.url()
-    if not url:
-        continue
-    desc = sym.description()
-    if desc:
-        desc = re.split(r'(?<=[.!?:])\s', desc)[0]
-    else:
-        desc = sym.type_description(as_html=True)
-    if desc:
-        desc = " &mdash; " + desc
-    body.append('<li>' + href(url, code(name)) + desc + '\n')
-body.append('</ul>\n')
-BasicHtmlFile("index.html").write("Index", "Index", ''.join(body))
-
-# write index.js
-body = []
-body.append('var jvXRef = {\n')
-for name in sorted(Symbol.all_names.keys()):
-    sym = Symbol.get(name)
-    if sym.is_private():
-        continue
-    url = sym.url()
-    if not url:
-        continue
-    body.append("  '%s': '%s',\n"%(name, url))
-body.append('};\n')
-BasicFile("index.js").write(''.join(body))
-
-# write jsdoc.css
-fname = find_data_file("jsdoc.css")
-BasicFile("jsdoc.css").write(open(fname).read())
-
-# write jsdoc.js
-fname = find_data_file("jsdoc.js")
-BasicFile("jsdoc.js").write(open(fname).read())
+for fname, names in Symbol.pages.items():
+    if in_namespaces(names[0], args.only):
+        html = HtmlFile.get(fname)
+        for name in names:
+            html.add_symbol(name)
+
+pages = sorted(HtmlFile.all_files.keys())
+if args.shard:
+    k, n = args.shard
+    pages = pages[k-1::n]
+start = time.perf_counter()
+if args.low_memory:
+    release = plan_doc_release(pages)
+    for k, fname in enumerate(pages):
+        html = HtmlFile.all_files.pop(fname)
+        html.generate()
+        for sym in release[k]:
+            sym.release_doc()
+    html = None
+else:
+    for fname in pages:
+        html = HtmlFile.all_files[fname]
+        html.generate()
+if args.verbose and pages:
+    elapsed = time.perf_counter() - start
+    print("wrote %d pages in %.2fs (%.1f pages/s)"
+          % (len(pages), elapsed, len(pages) / elapsed),
+          file=sys.stderr)
+
+if args.shard:
+    # the index is written by the --merge step
+    write_shard_manifest(args.shard, index_entries(args.only, set(pages)))
+    BasicFile.finish_gzip()
+    raise SystemExit(0)
+
+# write the index pages, index.js, jsdoc.css and jsdoc.js
+write_index(index_entries(args.only), args.index_depth,
+            args.index_max_entries)
+write_xref(index_entries(args.only))
+write_data_files()
+BasicFile.finish_gzip()
@@ -0,0 +1,35 @@
+# Copyright (C) 2011  Jochen Voss <voss@seehuhn.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import os
+import os.path
+import types
+
+import pytest
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(TOP_DIR, 'jvjsdoc.py')
+
+@pytest.fixture(scope='session')
+def jvjsdoc():
+    """The definitions from jvjsdoc.py, without running the main program.
+
+    jvjsdoc.py is a script and cannot be imported, so everything
+    before the '# main program' marker is executed in a fresh
+    namespace.
+    """
+    source = open(SCRIPT, encoding='utf-8').read()
+    source = source.split('\n# main program\n', 1)[0]
+    names = { '__name__': 'jvjsdoc', 'cost_report': None }
+    cwd = os.getcwd()
+    # without config.py, the version is read from configure.ac
+    os.chdir(TOP_DIR)
+    try:
+        exec(compile(source, SCRIPT, 'exec'), names)
+    finally:
+        os.chdir(cwd)
+    return types.SimpleNamespace(**names)
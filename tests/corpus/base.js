@@ -0,0 +1,13 @@
+goog.provide('base.Thing');
+
+/**
+ * Base thing.
+ * @constructor
+ */
+base.Thing = function() {};
+
+/**
+ * Do it.
+ * @param {string} s Input.
+ */
+base.Thing.prototype.doIt = function(s) {};
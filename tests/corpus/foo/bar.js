@@ -0,0 +1,41 @@
+/**
+ * @fileoverview Test file.
+ */
+goog.provide('foo.Bar');
+goog.provide('foo.util');
+
+/**
+ * A bar class.  It does things.
+ * @param {number} x The x value.
+ * @constructor
+ */
+foo.Bar = function(x) {
+  /**
+   * The x value.
+   * @type {number}
+   */
+  this.x = x;
+};
+
+/**
+ * Get the value.  More text here.
+ * @return {number} the value.
+ */
+foo.Bar.prototype.get = function() {
+  return this.x; // see 'http://example.com/*'
+};
+
+/**
+ * Colours.
+ * @enum {string}
+ */
+foo.util.Colour = {
+  RED: 'r',
+  GREEN: 'g'
+};
+
+/**
+ * Helper.
+ * @private
+ */
+foo.util.helper_ = function() {};
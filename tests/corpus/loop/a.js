@@ -0,0 +1,4 @@
+goog.provide('loop.A');
+goog.require('loop.B');
+/** First A. */
+loop.A.f = function() {};
@@ -0,0 +1,4 @@
+goog.provide('loop.B');
+goog.require('loop.A');
+/** Second def. */
+loop.A.f = function() {};
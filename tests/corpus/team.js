@@ -0,0 +1,18 @@
+goog.provide('team.Widget');
+goog.require('foo.Bar');
+
+/**
+ * A widget.
+ * @constructor
+ * @extends {base.Thing}
+ */
+team.Widget = function() {};
+
+/** @override */
+team.Widget.prototype.doIt = function(s) {};
+
+/**
+ * Uses a bar.
+ * @param {foo.Bar} bar The bar.
+ */
+team.Widget.prototype.use = function(bar) {};
@@ -0,0 +1,43 @@
+goog.provide('team.Button');
+goog.require('team.Widget');
+
+/**
+ * A button.  It can be pressed.
+ * @constructor
+ * @extends {team.Widget}
+ */
+team.Button = function() {
+  /**
+   * Whether the button is pressed.
+   * @type {boolean}
+   * @protected
+   */
+  this.pressed = false;
+};
+
+/** @inheritDoc */
+team.Button.prototype.doIt = function(s) {};
+
+/**
+ * Press the button.
+ * @deprecated Use click() instead.
+ */
+team.Button.prototype.press = function() {
+  var url = 'http://example.com/*press*/';
+  return /\/*$/.test(url) ? a / b : '//';
+};
+
+/**
+ * Click the button.
+ * @param {number=} count How often to click.
+ * @see team.Button.prototype.press
+ */
+team.Button.prototype.click = function(count) {};
+
+/**
+ * The label of the button.
+ * @param {string} prefix Text to put in front.
+ * @param {number=} width The maximal width.
+ * @return {string} The label.
+ */
+team.Button.prototype.label = function(prefix, width) {};
@@ -0,0 +1,11 @@
+goog.provide('top');
+goog.provide('top.Thing');
+/**
+ * The top namespace.  Used for testing.
+ */
+var top = {};
+/**
+ * A thing.
+ * @constructor
+ */
+top.Thing = function() {};
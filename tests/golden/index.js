@@ -0,0 +1,29 @@
+var jvXRef = {
+  'base': 'base.html',
+  'base.Thing': 'base/Thing.html',
+  'base.Thing.doIt': 'base/Thing.html#doIt',
+  'foo': 'foo.html',
+  'foo.Bar': 'foo/Bar.html',
+  'foo.Bar.get': 'foo/Bar.html#get',
+  'foo.Bar.x': 'foo/Bar.html#x',
+  'foo.util': 'foo/util.html',
+  'foo.util.Colour': 'foo/util/Colour.html',
+  'foo.util.Colour.GREEN': 'foo/util/Colour.html#GREEN',
+  'foo.util.Colour.RED': 'foo/util/Colour.html#RED',
+  'loop': 'loop.html',
+  'loop.A': 'loop/A.html',
+  'loop.A.f': 'loop/A.html#f',
+  'loop.B': 'loop.html#B',
+  'team': 'team.html',
+  'team.Button': 'team/Button.html',
+  'team.Button.click': 'team/Button.html#click',
+  'team.Button.doIt': 'team/Button.html#doIt',
+  'team.Button.label': 'team/Button.html#label',
+  'team.Button.press': 'team/Button.html#press',
+  'team.Button.pressed': 'team/Button.html#pressed',
+  'team.Widget': 'team/Widget.html',
+  'team.Widget.doIt': 'team/Widget.html#doIt',
+  'team.Widget.use': 'team/Widget.html#use',
+  'top': 'top.html',
+  'top.Thing': 'top/Thing.html',
+};
@@ -0,0 +1,89 @@
+var k,m=this;function aa(){}
+function ba(a){var b=typeof a;if("object"==b)if(a){if(a instanceof Array)return"array";if(a instanceof Object)return b;var c=Object.prototype.toString.call(a);if("[object Window]"==c)return"object";if("[object Array]"==c||"number"==typeof a.length&&"undefined"!=typeof a.splice&&"undefined"!=typeof a.propertyIsEnumerable&&!a.propertyIsEnumerable("splice"))return"array";if("[object Function]"==c||"undefined"!=typeof a.call&&"undefined"!=typeof a.propertyIsEnumerable&&!a.propertyIsEnumerable("call"))return"function"}else return"null";else if("function"==
+b&&"undefined"==typeof a.call)return"object";return b}function q(a){return"array"==ba(a)}function ca(a){var b=ba(a);return"array"==b||"object"==b&&"number"==typeof a.length}function t(a){return"string"==typeof a}function da(a){return"number"==typeof a}function ea(a){return"function"==ba(a)}function fa(a){var b=typeof a;return"object"==b&&null!=a||"function"==b}function ga(a){return a[ha]||(a[ha]=++ia)}var ha="closure_uid_"+(1E9*Math.random()>>>0),ia=0;
+function ja(a,b,c){return a.call.apply(a.bind,arguments)}function ka(a,b,c){if(!a)throw Error();if(2<arguments.length){var d=Array.prototype.slice.call(arguments,2);return function(){var c=Array.prototype.slice.call(arguments);Array.prototype.unshift.apply(c,d);return a.apply(b,c)}}return function(){return a.apply(b,arguments)}}function u(a,b,c){u=Function.prototype.bind&&-1!=Function.prototype.bind.toString().indexOf("native code")?ja:ka;return u.apply(null,arguments)}var w=Date.now||function(){return+new Date};
+function x(a,b){function c(){}c.prototype=b.prototype;a.i=b.prototype;a.prototype=new c;a.Tb=function(a,c,f){var g=Array.prototype.slice.call(arguments,2);return b.prototype[c].apply(a,g)}};var la;function ma(a){return a.replace(/^[\s\xa0]+|[\s\xa0]+$/g,"")}function na(a){if(!oa.test(a))return a;-1!=a.indexOf("&")&&(a=a.replace(pa,"&amp;"));-1!=a.indexOf("<")&&(a=a.replace(qa,"&lt;"));-1!=a.indexOf(">")&&(a=a.replace(ra,"&gt;"));-1!=a.indexOf('"')&&(a=a.replace(sa,"&quot;"));-1!=a.indexOf("'")&&(a=a.replace(ta,"&#39;"));return a}var pa=/&/g,qa=/</g,ra=/>/g,sa=/"/g,ta=/'/g,oa=/[&<>"']/;function ua(a){return String(a).replace(/([-()\[\]{}+?*.$\^|,:#<!\\])/g,"\\$1").replace(/\x08/g,"\\x08")}
+function va(a,b){return a<b?-1:a>b?1:0};var wa="closure_listenable_"+(1E6*Math.random()|0);function xa(a){try{return!(!a||!a[wa])}catch(b){return!1}}var za=0;function Aa(a,b,c,d,e){this.I=a;this.la=null;this.src=b;this.type=c;this.capture=!!d;this.fa=e;this.key=++za;this.T=this.da=!1}function Ba(a){a.T=!0;a.I=null;a.la=null;a.src=null;a.fa=null};function Ca(a,b){for(var c in a)b.call(void 0,a[c],c,a)}function Da(){var a=Ea,b;for(b in a)return!1;return!0}var Fa="constructor hasOwnProperty isPrototypeOf propertyIsEnumerable toLocaleString toString valueOf".split(" ");function Ga(a,b){for(var c,d,e=1;e<arguments.length;e++){d=arguments[e];for(c in d)a[c]=d[c];for(var f=0;f<Fa.length;f++)c=Fa[f],Object.prototype.hasOwnProperty.call(d,c)&&(a[c]=d[c])}};var z=Array.prototype,Ha=z.indexOf?function(a,b,c){return z.indexOf.call(a,b,c)}:function(a,b,c){c=null==c?0:0>c?Math.max(0,a.length+c):c;if(t(a))return t(b)&&1==b.length?a.indexOf(b,c):-1;for(;c<a.length;c++)if(c in a&&a[c]===b)return c;return-1},Ia=z.forEach?function(a,b,c){z.forEach.call(a,b,c)}:function(a,b,c){for(var d=a.length,e=t(a)?a.split(""):a,f=0;f<d;f++)f in e&&b.call(c,e[f],f,a)},Ja=z.filter?function(a,b,c){return z.filter.call(a,b,c)}:function(a,b,c){for(var d=a.length,e=[],f=0,g=t(a)?
+a.split(""):a,h=0;h<d;h++)if(h in g){var l=g[h];b.call(c,l,h,a)&&(e[f++]=l)}return e},Ka=z.map?function(a,b,c){return z.map.call(a,b,c)}:function(a,b,c){for(var d=a.length,e=Array(d),f=t(a)?a.split(""):a,g=0;g<d;g++)g in f&&(e[g]=b.call(c,f[g],g,a));return e};function La(a,b){return 0<=Ha(a,b)}function Ma(a){var b=a.length;if(0<b){for(var c=Array(b),d=0;d<b;d++)c[d]=a[d];return c}return[]}function Na(a,b,c){return 2>=arguments.length?z.slice.call(a,b):z.slice.call(a,b,c)};function A(a){this.src=a;this.k={};this.ca=0}A.prototype.add=function(a,b,c,d,e){var f=this.k[a];f||(f=this.k[a]=[],this.ca++);var g=Oa(f,b,d,e);-1<g?(a=f[g],c||(a.da=!1)):(a=new Aa(b,this.src,a,!!d,e),a.da=c,f.push(a));return a};A.prototype.remove=function(a,b,c,d){if(!(a in this.k))return!1;var e=this.k[a];b=Oa(e,b,c,d);return-1<b?(Ba(e[b]),z.splice.call(e,b,1),0==e.length&&(delete this.k[a],this.ca--),!0):!1};
+function Pa(a,b){var c=b.type;if(!(c in a.k))return!1;var d=a.k[c],e=Ha(d,b),f;(f=0<=e)&&z.splice.call(d,e,1);f&&(Ba(b),0==a.k[c].length&&(delete a.k[c],a.ca--));return f}A.prototype.ma=function(a){var b=0,c;for(c in this.k)if(!a||c==a){for(var d=this.k[c],e=0;e<d.length;e++)++b,Ba(d[e]);delete this.k[c];this.ca--}return b};A.prototype.X=function(a,b,c,d){a=this.k[a];var e=-1;a&&(e=Oa(a,b,c,d));return-1<e?a[e]:null};
+function Oa(a,b,c,d){for(var e=0;e<a.length;++e){var f=a[e];if(!f.T&&f.I==b&&f.capture==!!c&&f.fa==d)return e}return-1};var Qa,Ra,Sa,Ta,B;function Ua(){return m.navigator?m.navigator.userAgent:null}function Va(){return m.navigator}Ta=Sa=Ra=Qa=!1;var Wa;if(Wa=Ua()){var Xa=Va();Qa=0==Wa.lastIndexOf("Opera",0);Ra=!Qa&&(-1!=Wa.indexOf("MSIE")||-1!=Wa.indexOf("Trident"));Sa=!Qa&&-1!=Wa.indexOf("WebKit");Ta=!Qa&&!Sa&&!Ra&&"Gecko"==Xa.product}var D=Qa,E=Ra,F=Ta,G=Sa,Ya=Va();B=-1!=(Ya&&Ya.platform||"").indexOf("Mac");var Za=!!Va()&&-1!=(Va().appVersion||"").indexOf("X11");
+function $a(){var a=m.document;return a?a.documentMode:void 0}var ab;a:{var bb="",cb;if(D&&m.opera)var db=m.opera.version,bb="function"==typeof db?db():db;else if(F?cb=/rv\:([^\);]+)(\)|;)/:E?cb=/\b(?:MSIE|rv)[: ]([^\);]+)(\)|;)/:G&&(cb=/WebKit\/(\S+)/),cb)var eb=cb.exec(Ua()),bb=eb?eb[1]:"";if(E){var fb=$a();if(fb>parseFloat(bb)){ab=String(fb);break a}}ab=bb}var gb={};
+function H(a){var b;if(!(b=gb[a])){b=0;for(var c=ma(String(ab)).split("."),d=ma(String(a)).split("."),e=Math.max(c.length,d.length),f=0;0==b&&f<e;f++){var g=c[f]||"",h=d[f]||"",l=RegExp("(\\d*)(\\D*)","g"),r=RegExp("(\\d*)(\\D*)","g");do{var p=l.exec(g)||["","",""],s=r.exec(h)||["","",""];if(0==p[0].length&&0==s[0].length)break;b=va(0==p[1].length?0:parseInt(p[1],10),0==s[1].length?0:parseInt(s[1],10))||va(0==p[2].length,0==s[2].length)||va(p[2],s[2])}while(0==b)}b=gb[a]=0<=b}return b}
+var hb=m.document,I=hb&&E?$a()||("CSS1Compat"==hb.compatMode?parseInt(ab,10):5):void 0;var ib=!E||E&&9<=I,jb=E&&!H("9");!G||H("528");F&&H("1.9b")||E&&H("8")||D&&H("9.5")||G&&H("528");F&&!H("8")||E&&H("9");function K(){0!=kb&&(lb[ga(this)]=this)}var kb=0,lb={};K.prototype.Ka=!1;K.prototype.B=function(){if(!this.Ka&&(this.Ka=!0,this.e(),0!=kb)){var a=ga(this);delete lb[a]}};K.prototype.e=function(){if(this.Za)for(;this.Za.length;)this.Za.shift()()};function mb(a){a&&"function"==typeof a.B&&a.B()};function L(a,b){this.type=a;this.currentTarget=this.target=b;this.defaultPrevented=this.K=!1;this.hb=!0}L.prototype.e=function(){};L.prototype.B=function(){};L.prototype.stopPropagation=function(){this.K=!0};L.prototype.preventDefault=function(){this.defaultPrevented=!0;this.hb=!1};function nb(a){nb[" "](a);return a}nb[" "]=aa;function M(a,b){L.call(this,a?a.type:"");this.relatedTarget=this.currentTarget=this.target=null;this.charCode=this.keyCode=this.button=this.screenY=this.screenX=this.clientY=this.clientX=this.offsetY=this.offsetX=0;this.metaKey=this.shiftKey=this.altKey=this.ctrlKey=!1;this.N=this.state=null;if(a){var c=this.type=a.type;this.target=a.target||a.srcElement;this.currentTarget=b;var d=a.relatedTarget;if(d){if(F){var e;a:{try{nb(d.nodeName);e=!0;break a}catch(f){}e=!1}e||(d=null)}}else"mouseover"==c?d=
+a.fromElement:"mouseout"==c&&(d=a.toElement);this.relatedTarget=d;this.offsetX=G||void 0!==a.offsetX?a.offsetX:a.layerX;this.offsetY=G||void 0!==a.offsetY?a.offsetY:a.layerY;this.clientX=void 0!==a.clientX?a.clientX:a.pageX;this.clientY=void 0!==a.clientY?a.clientY:a.pageY;this.screenX=a.screenX||0;this.screenY=a.screenY||0;this.button=a.button;this.keyCode=a.keyCode||0;this.charCode=a.charCode||("keypress"==c?a.keyCode:0);this.ctrlKey=a.ctrlKey;this.altKey=a.altKey;this.shiftKey=a.shiftKey;this.metaKey=
+a.metaKey;this.state=a.state;this.N=a;a.defaultPrevented&&this.preventDefault()}}x(M,L);M.prototype.stopPropagation=function(){M.i.stopPropagation.call(this);this.N.stopPropagation?this.N.stopPropagation():this.N.cancelBubble=!0};M.prototype.preventDefault=function(){M.i.preventDefault.call(this);var a=this.N;if(a.preventDefault)a.preventDefault();else if(a.returnValue=!1,jb)try{if(a.ctrlKey||112<=a.keyCode&&123>=a.keyCode)a.keyCode=-1}catch(b){}};M.prototype.e=function(){};var ob="closure_lm_"+(1E6*Math.random()|0),pb={},qb=0;function O(a,b,c,d,e){if(q(b)){for(var f=0;f<b.length;f++)O(a,b[f],c,d,e);return null}c=rb(c);if(xa(a))a=a.o(b,c,d,e);else{if(!b)throw Error("Invalid event type");var f=!!d,g=sb(a);g||(a[ob]=g=new A(a));c=g.add(b,c,!1,d,e);c.la||(d=tb(),c.la=d,d.src=a,d.I=c,a.addEventListener?a.addEventListener(b,d,f):a.attachEvent(b in pb?pb[b]:pb[b]="on"+b,d),qb++);a=c}return a}
+function tb(){var a=ub,b=ib?function(c){return a.call(b.src,b.I,c)}:function(c){c=a.call(b.src,b.I,c);if(!c)return c};return b}function vb(a,b,c,d,e){if(q(b))for(var f=0;f<b.length;f++)vb(a,b[f],c,d,e);else c=rb(c),xa(a)?a.s(b,c,d,e):a&&(a=sb(a))&&(b=a.X(b,c,!!d,e))&&P(b)}
+function P(a){if(da(a)||!a||a.T)return!1;var b=a.src;if(xa(b))return Pa(b.C,a);var c=a.type,d=a.la;b.removeEventListener?b.removeEventListener(c,d,a.capture):b.detachEvent&&b.detachEvent(c in pb?pb[c]:pb[c]="on"+c,d);qb--;(c=sb(b))?(Pa(c,a),0==c.ca&&(c.src=null,b[ob]=null)):Ba(a);return!0}function wb(a,b,c,d){var e=1;if(a=sb(a))if(b=a.k[b])for(b=Ma(b),a=0;a<b.length;a++){var f=b[a];f&&f.capture==c&&!f.T&&(e&=!1!==xb(f,d))}return Boolean(e)}
+function xb(a,b){var c=a.I,d=a.fa||a.src;a.da&&P(a);return c.call(d,b)}
+function ub(a,b){if(a.T)return!0;if(!ib){var c;if(!(c=b))a:{c=["window","event"];for(var d=m,e;e=c.shift();)if(null!=d[e])d=d[e];else{c=null;break a}c=d}e=c;c=new M(e,this);d=!0;if(!(0>e.keyCode||void 0!=e.returnValue)){a:{var f=!1;if(0==e.keyCode)try{e.keyCode=-1;break a}catch(g){f=!0}if(f||void 0==e.returnValue)e.returnValue=!0}e=[];for(f=c.currentTarget;f;f=f.parentNode)e.push(f);for(var f=a.type,h=e.length-1;!c.K&&0<=h;h--)c.currentTarget=e[h],d&=wb(e[h],f,!0,c);for(h=0;!c.K&&h<e.length;h++)c.currentTarget=
+e[h],d&=wb(e[h],f,!1,c)}return d}return xb(a,new M(b,this))}function sb(a){a=a[ob];return a instanceof A?a:null}var yb="__closure_events_fn_"+(1E9*Math.random()>>>0);function rb(a){return ea(a)?a:a[yb]||(a[yb]=function(b){return a.handleEvent(b)})};function Q(){K.call(this);this.C=new A(this);this.pb=this}x(Q,K);Q.prototype[wa]=!0;k=Q.prototype;k.Ba=null;k.addEventListener=function(a,b,c,d){O(this,a,b,c,d)};k.removeEventListener=function(a,b,c,d){vb(this,a,b,c,d)};
+k.dispatchEvent=function(a){var b,c=this.Ba;if(c)for(b=[];c;c=c.Ba)b.push(c);var c=this.pb,d=a.type||a;if(t(a))a=new L(a,c);else if(a instanceof L)a.target=a.target||c;else{var e=a;a=new L(d,c);Ga(a,e)}var e=!0,f;if(b)for(var g=b.length-1;!a.K&&0<=g;g--)f=a.currentTarget=b[g],e=zb(f,d,!0,a)&&e;a.K||(f=a.currentTarget=c,e=zb(f,d,!0,a)&&e,a.K||(e=zb(f,d,!1,a)&&e));if(b)for(g=0;!a.K&&g<b.length;g++)f=a.currentTarget=b[g],e=zb(f,d,!1,a)&&e;return e};
+k.e=function(){Q.i.e.call(this);this.C&&this.C.ma(void 0);this.Ba=null};k.o=function(a,b,c,d){return this.C.add(String(a),b,!1,c,d)};k.s=function(a,b,c,d){return this.C.remove(String(a),b,c,d)};function zb(a,b,c,d){b=a.C.k[String(b)];if(!b)return!0;b=Ma(b);for(var e=!0,f=0;f<b.length;++f){var g=b[f];if(g&&!g.T&&g.capture==c){var h=g.I,l=g.fa||g.src;g.da&&Pa(a.C,g);e=!1!==h.call(l,d)&&e}}return e&&!1!=d.hb}k.X=function(a,b,c,d){return this.C.X(String(a),b,c,d)};function Ab(a,b,c){Q.call(this);this.Q=a;this.$=c;this.p=b;O(b,[Bb,Cb,Db,Eb],this.handleEvent,!1,this);this.q=null;this.c=[];this.D=-1;this.j=0;this.H=this.g=null;this.Sa={}}x(Ab,Q);k=Ab.prototype;k.Xa=10;k.rb=!0;k.Ia=!1;k.ob=!1;k.lb=!1;var Bb="hilite",Cb="select",Eb="dismiss",Db="canceldismiss";k=Ab.prototype;
+k.handleEvent=function(a){if(a.target==this.p)switch(a.type){case Bb:this.A(a.U);break;case Cb:a=a.U;var b=this.c[Fb(this,a)],c=!!b&&this.Q.va&&this.Q.va(b);a&&b&&!c&&this.D!=a&&this.A(a);c||Gb(this);break;case Db:Hb(this);break;case Eb:Ib(this)}};function Jb(a){for(var b=a.j+a.c.length-1,c=a.D,d=0;d<a.c.length;d++){if(c>=a.j&&c<b)c++;else if(-1==c)c=a.j;else if(a.Ia&&c==b){a.A(-1);break}else if(a.ob&&c==b)c=a.j;else break;if(a.A(c))break}}
+function Kb(a){for(var b=a.j+a.c.length-1,c=a.D,d=0;d<a.c.length;d++){if(c>a.j)c--;else if(a.Ia&&c==a.j){a.A(-1);break}else if(!a.ob||-1!=c&&c!=a.j)break;else c=b;if(a.A(c))break}}k.A=function(a){var b=Fb(this,a),c=this.c[b];return c&&this.Q.va&&this.Q.va(c)?!1:(this.D=a,this.p.A(a),-1!=b)};
+function Gb(a){var b=Fb(a,a.D);if(-1!=b){var c=a.c[b],d=a.$,e=c.toString();if(d.R){var f=Lb(d,d.a.value,Mb(d.a)),g=Nb(d,d.a.value);d.Jb.test(e)||(e=e.replace(/[\s\xa0]+$/,"")+d.tb);d.Rb&&(0==f||/^[\s\xa0]*$/.test(g[f-1])||(e=" "+e),f==g.length-1&&(e+=" "));if(e!=g[f]){g[f]=e;e=d.a;(F||E&&H("9"))&&e.blur();e.value=g.join("");for(var h=0,l=0;l<=f;l++)h+=g[l].length;e.focus();f=h;g=d.a;e=f;Ob(g)?g.selectionStart=e:E&&(h=Pb(g),l=h[0],l.inRange(h[1])&&(e=Qb(g,e),l.collapse(!0),l.move("character",e),l.select()));
+g=d.a;Ob(g)?g.selectionEnd=f:E&&(h=Pb(g),e=h[1],h[0].inRange(e)&&(f=Qb(g,f),g=Qb(g,Mb(g)),e.collapse(!0),e.moveEnd("character",f-g),e.select()))}}else d.a.value=e;d.Fa=!0;a.lb?(a.q=null,Ib(a)):a.u();a.dispatchEvent({type:"update",U:c,index:b});a.lb&&a.$.update(!0);return!0}a.u();a.dispatchEvent({type:"update",U:null,index:null});return!1}k.u=function(){this.D=-1;this.q=null;this.j+=this.c.length;this.c=[];window.clearTimeout(this.H);this.H=null;this.p.u();this.dispatchEvent("suggestionsupdate");this.dispatchEvent(Eb)};
+function Ib(a){a.H||(a.H=window.setTimeout(u(a.u,a),100))}k.Ra=function(){return this.H?(window.clearTimeout(this.H),this.H=null,!0):!1};function Hb(a){a.Ra()||window.setTimeout(u(a.Ra,a),10)}k.e=function(){Ab.i.e.call(this);delete this.Sa;this.p.B();this.$.B();this.Q=null};k.Db=function(a,b,c){this.q==a&&this.Da(b,c)};
+k.Da=function(a,b){var c="object"==ba(b)&&b,d=(c?c.Ub():b)?Fb(this,this.D):-1;this.j+=this.c.length;this.c=a;for(var e=[],f=0;f<a.length;++f)e.push({id:this.j+f,data:a[f]});f=null;this.g&&(f=this.Sa[ga(this.g)]||this.g);this.p.qb=f;this.p.Da(e,this.q,this.g);f=this.rb;c&&void 0!==c.xb()&&(f=c.xb());this.D=-1;(f||0<=d)&&0!=e.length&&this.q&&(0<=d?this.A(this.j+d):Jb(this));this.dispatchEvent("suggestionsupdate")};function Fb(a,b){var c=b-a.j;return 0>c||c>=a.c.length?-1:c}
+k.sa=function(a){var b=this.$;b.sa.apply(b,arguments)};k.update=function(a){this.$.update(a)};function Rb(a){a=a.className;return t(a)&&a.match(/\S+/g)||[]}function Sb(a,b){for(var c=Rb(a),d=Na(arguments,1),e=c.length+d.length,f=c,g=0;g<d.length;g++)La(f,d[g])||f.push(d[g]);a.className=c.join(" ");return c.length==e}function Tb(a,b){var c=Rb(a),d=Na(arguments,1),c=Ub(c,d);a.className=c.join(" ")}function Ub(a,b){return Ja(a,function(a){return!La(b,a)})};function Vb(a){this.c=a||[];this.Pb=!1}function Wb(a,b,c){var d=[];if(""!=a){a=ua(a);a=RegExp("(^|\\W+)"+a,"i");for(var e=0;e<c.length&&d.length<b;e++){var f=c[e];String(f).match(a)&&d.push(f)}}return d}
+function Xb(a,b,c){for(var d=[],e=0;e<c.length;e++){var f=c[e],g=a.toLowerCase(),h=String(f).toLowerCase(),l=0;if(-1!=h.indexOf(g))l=parseInt((h.indexOf(g)/4).toString(),10);else for(var r=g.split(""),p=-1,s=10,y=0,N;N=r[y];y++)N=h.indexOf(N),N>p?(p=N-p-1,p>s-5&&(p=s-5),l+=p,p=N):(l+=s,s+=5);l<6*g.length&&d.push({Mb:f,ib:l,index:e})}d.sort(function(a,b){var c=a.ib-b.ib;return 0!=c?c:a.index-b.index});a=[];for(y=0;y<b&&y<d.length;y++)a.push(d[y].Mb);return a};function R(a,b){this.x=void 0!==a?a:0;this.y=void 0!==b?b:0}R.prototype.W=function(){return new R(this.x,this.y)};function Yb(a,b){return new R(a.x-b.x,a.y-b.y)}R.prototype.round=function(){this.x=Math.round(this.x);this.y=Math.round(this.y);return this};function S(a,b,c,d){this.top=a;this.right=b;this.bottom=c;this.left=d}S.prototype.W=function(){return new S(this.top,this.right,this.bottom,this.left)};S.prototype.contains=function(a){return this&&a?a instanceof S?a.left>=this.left&&a.right<=this.right&&a.top>=this.top&&a.bottom<=this.bottom:a.x>=this.left&&a.x<=this.right&&a.y>=this.top&&a.y<=this.bottom:!1};
+S.prototype.round=function(){this.top=Math.round(this.top);this.right=Math.round(this.right);this.bottom=Math.round(this.bottom);this.left=Math.round(this.left);return this};function Zb(a,b){this.width=a;this.height=b}Zb.prototype.W=function(){return new Zb(this.width,this.height)};Zb.prototype.round=function(){this.width=Math.round(this.width);this.height=Math.round(this.height);return this};function $b(a,b,c,d){this.left=a;this.top=b;this.width=c;this.height=d}$b.prototype.W=function(){return new $b(this.left,this.top,this.width,this.height)};$b.prototype.contains=function(a){return a instanceof $b?this.left<=a.left&&this.left+this.width>=a.left+a.width&&this.top<=a.top&&this.top+this.height>=a.top+a.height:a.x>=this.left&&a.x<=this.left+this.width&&a.y>=this.top&&a.y<=this.top+this.height};
+$b.prototype.round=function(){this.left=Math.round(this.left);this.top=Math.round(this.top);this.width=Math.round(this.width);this.height=Math.round(this.height);return this};var ac=!E||E&&9<=I;!F&&!E||E&&E&&9<=I||F&&H("1.9.1");E&&H("9");function T(a){return a?new bc(U(a)):la||(la=new bc)}function cc(a){var b=document;return t(a)?b.getElementById(a):a}function dc(){var a=document;return a.querySelectorAll&&a.querySelector?a.querySelectorAll(".hidden"):ec()}
+function ec(){var a,b,c,d;a=document;if(a.querySelectorAll&&a.querySelector)return a.querySelectorAll(".hidden");if(a.getElementsByClassName){var e=a.getElementsByClassName("hidden");return e}e=a.getElementsByTagName("*");d={};for(b=c=0;a=e[b];b++){var f=a.className;"function"==typeof f.split&&La(f.split(/\s+/),"hidden")&&(d[c++]=a)}d.length=c;return d}
+function fc(a,b){Ca(b,function(b,d){"style"==d?a.style.cssText=b:"class"==d?a.className=b:"for"==d?a.htmlFor=b:d in gc?a.setAttribute(gc[d],b):0==d.lastIndexOf("aria-",0)||0==d.lastIndexOf("data-",0)?a.setAttribute(d,b):a[d]=b})}var gc={cellpadding:"cellPadding",cellspacing:"cellSpacing",colspan:"colSpan",frameborder:"frameBorder",height:"height",maxlength:"maxLength",role:"role",rowspan:"rowSpan",type:"type",usemap:"useMap",valign:"vAlign",width:"width"};
+function hc(a){return G||"CSS1Compat"!=a.compatMode?a.body||a.documentElement:a.documentElement}function ic(a){return a.parentWindow||a.defaultView}function jc(a,b,c){function d(c){c&&b.appendChild(t(c)?a.createTextNode(c):c)}for(var e=2;e<c.length;e++){var f=c[e];if(!ca(f)||fa(f)&&0<f.nodeType)d(f);else{var g;a:{if(f&&"number"==typeof f.length){if(fa(f)){g="function"==typeof f.item||"string"==typeof f.item;break a}if(ea(f)){g="function"==typeof f.item;break a}}g=!1}Ia(g?Ma(f):f,d)}}}
+function U(a){return 9==a.nodeType?a:a.ownerDocument||a.document}function bc(a){this.l=a||m.document||document}k=bc.prototype;k.Ja=function(a,b,c){var d=this.l,e=arguments,f=e[0],g=e[1];if(!ac&&g&&(g.name||g.type)){f=["<",f];g.name&&f.push(' name="',na(g.name),'"');if(g.type){f.push(' type="',na(g.type),'"');var h={};Ga(h,g);delete h.type;g=h}f.push(">");f=f.join("")}f=d.createElement(f);g&&(t(g)?f.className=g:q(g)?Sb.apply(null,[f].concat(g)):fc(f,g));2<e.length&&jc(d,f,e);return f};
+k.createElement=function(a){return this.l.createElement(a)};k.createTextNode=function(a){return this.l.createTextNode(String(a))};function kc(a){return"CSS1Compat"==a.l.compatMode}function lc(a){var b=a.l;a=hc(b);b=ic(b);return E&&H("10")&&b.pageYOffset!=a.scrollTop?new R(a.scrollLeft,a.scrollTop):new R(b.pageXOffset||a.scrollLeft,b.pageYOffset||a.scrollTop)}k.appendChild=function(a,b){a.appendChild(b)};function mc(a){for(var b;b=a.firstChild;)a.removeChild(b)}
+k.removeNode=function(a){return a&&a.parentNode?a.parentNode.removeChild(a):null};k.contains=function(a,b){if(a.contains&&1==b.nodeType)return a==b||a.contains(b);if("undefined"!=typeof a.compareDocumentPosition)return a==b||Boolean(a.compareDocumentPosition(b)&16);for(;b&&a!=b;)b=b.parentNode;return b==a};function V(a,b){var c=U(a);return c.defaultView&&c.defaultView.getComputedStyle&&(c=c.defaultView.getComputedStyle(a,null))?c[b]||c.getPropertyValue(b)||"":""}function W(a,b){return V(a,b)||(a.currentStyle?a.currentStyle[b]:null)||a.style&&a.style[b]}
+function nc(a){var b;try{b=a.getBoundingClientRect()}catch(c){return{left:0,top:0,right:0,bottom:0}}E&&a.ownerDocument.body&&(a=a.ownerDocument,b.left-=a.documentElement.clientLeft+a.body.clientLeft,b.top-=a.documentElement.clientTop+a.body.clientTop);return b}
+function oc(a){if(E&&!(E&&8<=I))return a.offsetParent;var b=U(a),c=W(a,"position"),d="fixed"==c||"absolute"==c;for(a=a.parentNode;a&&a!=b;a=a.parentNode)if(c=W(a,"position"),d=d&&"static"==c&&a!=b.documentElement&&a!=b.body,!d&&(a.scrollWidth>a.clientWidth||a.scrollHeight>a.clientHeight||"fixed"==c||"absolute"==c||"relative"==c))return a;return null}
+function pc(a){for(var b=new S(0,Infinity,Infinity,0),c=T(a),d=c.l.body,e=c.l.documentElement,f=hc(c.l);a=oc(a);)if(!(E&&0==a.clientWidth||G&&0==a.clientHeight&&a==d||a==d||a==e||"visible"==W(a,"overflow"))){var g=X(a),h;h=a;if(F&&!H("1.9")){var l=parseFloat(V(h,"borderLeftWidth"));if(qc(h))var r=h.offsetWidth-h.clientWidth-l-parseFloat(V(h,"borderRightWidth")),l=l+r;h=new R(l,parseFloat(V(h,"borderTopWidth")))}else h=new R(h.clientLeft,h.clientTop);g.x+=h.x;g.y+=h.y;b.top=Math.max(b.top,g.y);b.right=
+Math.min(b.right,g.x+a.clientWidth);b.bottom=Math.min(b.bottom,g.y+a.clientHeight);b.left=Math.max(b.left,g.x)}d=f.scrollLeft;f=f.scrollTop;b.left=Math.max(b.left,d);b.top=Math.max(b.top,f);c=(ic(c.l)||window).document;c="CSS1Compat"==c.compatMode?c.documentElement:c.body;c=new Zb(c.clientWidth,c.clientHeight);b.right=Math.min(b.right,d+c.width);b.bottom=Math.min(b.bottom,f+c.height);return 0<=b.top&&0<=b.left&&b.bottom>b.top&&b.right>b.left?b:null}
+function X(a){var b,c=U(a),d=W(a,"position"),e=F&&c.getBoxObjectFor&&!a.getBoundingClientRect&&"absolute"==d&&(b=c.getBoxObjectFor(a))&&(0>b.screenX||0>b.screenY),f=new R(0,0),g;b=c?U(c):document;g=!E||E&&9<=I||kc(T(b))?b.documentElement:b.body;if(a==g)return f;if(a.getBoundingClientRect)b=nc(a),a=lc(T(c)),f.x=b.left+a.x,f.y=b.top+a.y;else if(c.getBoxObjectFor&&!e)b=c.getBoxObjectFor(a),a=c.getBoxObjectFor(g),f.x=b.screenX-a.screenX,f.y=b.screenY-a.screenY;else{b=a;do{f.x+=b.offsetLeft;f.y+=b.offsetTop;
+b!=a&&(f.x+=b.clientLeft||0,f.y+=b.clientTop||0);if(G&&"fixed"==W(b,"position")){f.x+=c.body.scrollLeft;f.y+=c.body.scrollTop;break}b=b.offsetParent}while(b&&b!=a);if(D||G&&"absolute"==d)f.y-=c.body.offsetTop;for(b=a;(b=oc(b))&&b!=c.body&&b!=g;)f.x-=b.scrollLeft,D&&"TR"==b.tagName||(f.y-=b.scrollTop)}return f}function rc(a,b){"number"==typeof a&&(a=(b?Math.round(a):a)+"px");return a}
+function sc(a){var b=tc;if("none"!=W(a,"display"))return b(a);var c=a.style,d=c.display,e=c.visibility,f=c.position;c.visibility="hidden";c.position="absolute";c.display="inline";a=b(a);c.display=d;c.position=f;c.visibility=e;return a}function tc(a){var b=a.offsetWidth,c=a.offsetHeight,d=G&&!b&&!c;return(void 0===b||d)&&a.getBoundingClientRect?(a=nc(a),new Zb(a.right-a.left,a.bottom-a.top)):new Zb(b,c)}function qc(a){return"rtl"==W(a,"direction")}var uc=F?"MozUserSelect":G?"WebkitUserSelect":null;
+function vc(a){var b=a.getElementsByTagName("*");if(uc){var c="none";a.style[uc]=c;if(b){a=0;for(var d;d=b[a];a++)d.style[uc]=c}}else if(E||D)if(c="on",a.setAttribute("unselectable",c),b)for(a=0;d=b[a];a++)d.setAttribute("unselectable",c)}function wc(a,b){if(/^\d+px?$/.test(b))return parseInt(b,10);var c=a.style.left,d=a.runtimeStyle.left;a.runtimeStyle.left=a.currentStyle.left;a.style.left=b;var e=a.style.pixelLeft;a.style.left=c;a.runtimeStyle.left=d;return e}
+function xc(a,b){var c=a.currentStyle?a.currentStyle[b]:null;return c?wc(a,c):0}var yc={thin:2,medium:4,thick:6};function zc(a,b){if("none"==(a.currentStyle?a.currentStyle[b+"Style"]:null))return 0;var c=a.currentStyle?a.currentStyle[b+"Width"]:null;return c in yc?yc[c]:wc(a,c)}
+function Ac(a){if(E&&!(E&&9<=I)){var b=zc(a,"borderLeft"),c=zc(a,"borderRight"),d=zc(a,"borderTop");a=zc(a,"borderBottom");return new S(d,c,a,b)}b=V(a,"borderLeftWidth");c=V(a,"borderRightWidth");d=V(a,"borderTopWidth");a=V(a,"borderBottomWidth");return new S(parseFloat(d),parseFloat(c),parseFloat(a),parseFloat(b))}var Bc=/matrix\([0-9\.\-]+, [0-9\.\-]+, [0-9\.\-]+, [0-9\.\-]+, ([0-9\.\-]+)p?x?, ([0-9\.\-]+)p?x?\)/;function Cc(a,b){return(b&4&&qc(a)?b^2:b)&-5};function Dc(a,b){Q.call(this);this.P=a||1;this.V=b||m;this.ta=u(this.Nb,this);this.ya=w()}x(Dc,Q);k=Dc.prototype;k.enabled=!1;k.f=null;k.Nb=function(){if(this.enabled){var a=w()-this.ya;0<a&&a<0.8*this.P?this.f=this.V.setTimeout(this.ta,this.P-a):(this.f&&(this.V.clearTimeout(this.f),this.f=null),this.dispatchEvent(Ec),this.enabled&&(this.f=this.V.setTimeout(this.ta,this.P),this.ya=w()))}};k.start=function(){this.enabled=!0;this.f||(this.f=this.V.setTimeout(this.ta,this.P),this.ya=w())};
+k.stop=function(){this.enabled=!1;this.f&&(this.V.clearTimeout(this.f),this.f=null)};k.e=function(){Dc.i.e.call(this);this.stop();delete this.V};var Ec="tick";function Fc(a,b,c){K.call(this);this.za=a;this.P=b||0;this.Y=c;this.sb=u(this.ub,this)}x(Fc,K);k=Fc.prototype;k.O=0;k.e=function(){Fc.i.e.call(this);this.stop();delete this.za;delete this.Y};k.start=function(a){this.stop();var b=this.sb;a=void 0!==a?a:this.P;if(!ea(b))if(b&&"function"==typeof b.handleEvent)b=u(b.handleEvent,b);else throw Error("Invalid listener argument");this.O=2147483647<a?-1:m.setTimeout(b,a||0)};k.stop=function(){0!=this.O&&m.clearTimeout(this.O);this.O=0};
+k.ub=function(){this.O=0;this.za&&this.za.call(this.Y)};var Ea={},Gc=null;function Hc(a){a=ga(a);delete Ea[a];Da()&&Gc&&Gc.stop()}function Ic(){Gc||(Gc=new Fc(function(){Jc()},20));var a=Gc;0!=a.O||a.start()}function Jc(){var a=w();Ca(Ea,function(b){Kc(b,a)});Da()||Ic()};function Lc(){Q.call(this);this.r=Mc;this.La=this.startTime=null}x(Lc,Q);var Mc=0;Lc.prototype.J=function(){this.v("begin")};Lc.prototype.S=function(){this.v("end")};Lc.prototype.v=function(a){this.dispatchEvent(a)};function Nc(a,b,c,d){Lc.call(this);if(!q(a)||!q(b))throw Error("Start and end parameters must be arrays");if(a.length!=b.length)throw Error("Start and end points must be the same length");this.ba=a;this.vb=b;this.duration=c;this.Ga=d;this.coords=[]}x(Nc,Lc);k=Nc.prototype;k.n=0;
+k.play=function(a){if(a||this.r==Mc)this.n=0,this.coords=this.ba;else if(1==this.r)return!1;Hc(this);this.startTime=a=w();-1==this.r&&(this.startTime-=this.duration*this.n);this.La=this.startTime+this.duration;this.n||this.J();this.v("play");-1==this.r&&this.v("resume");this.r=1;var b=ga(this);b in Ea||(Ea[b]=this);Ic();Kc(this,a);return!0};k.stop=function(a){Hc(this);this.r=Mc;a&&(this.n=1);Oc(this,this.n);this.v("stop");this.S()};k.e=function(){this.r==Mc||this.stop(!1);this.v("destroy");Nc.i.e.call(this)};
+function Kc(a,b){a.n=(b-a.startTime)/(a.La-a.startTime);1<=a.n&&(a.n=1);Oc(a,a.n);1==a.n?(a.r=Mc,Hc(a),a.v("finish"),a.S()):1==a.r&&a.Aa()}function Oc(a,b){ea(a.Ga)&&(b=a.Ga(b));a.coords=Array(a.ba.length);for(var c=0;c<a.ba.length;c++)a.coords[c]=(a.vb[c]-a.ba[c])*b+a.ba[c]}k.Aa=function(){this.v("animate")};k.v=function(a){this.dispatchEvent(new Pc(a,this))};
+function Pc(a,b){L.call(this,a);this.coords=b.coords;this.x=b.coords[0];this.y=b.coords[1];this.z=b.coords[2];this.duration=b.duration;this.n=b.n;this.state=b.r}x(Pc,L);function Y(a,b,c,d,e){Nc.call(this,b,c,d,e);this.element=a}x(Y,Nc);Y.prototype.oa=aa;Y.prototype.Aa=function(){this.oa();Y.i.Aa.call(this)};Y.prototype.S=function(){this.oa();Y.i.S.call(this)};Y.prototype.J=function(){this.oa();Y.i.J.call(this)};function Qc(a,b,c,d,e){da(b)&&(b=[b]);da(c)&&(c=[c]);Y.call(this,a,b,c,d,e);if(1!=b.length||1!=c.length)throw Error("Start and end points must be 1D");}x(Qc,Y);
+Qc.prototype.oa=function(){var a=this.coords[0],b=this.element.style;"opacity"in b?b.opacity=a:"MozOpacity"in b?b.MozOpacity=a:"filter"in b&&(b.filter=""===a?"":"alpha(opacity="+100*a+")")};Qc.prototype.show=function(){this.element.style.display=""};function Rc(a,b,c){Qc.call(this,a,1,0,b,c)}x(Rc,Qc);Rc.prototype.J=function(){this.show();Rc.i.J.call(this)};Rc.prototype.S=function(){this.element.style.display="none";Rc.i.S.call(this)};function Sc(a,b,c){Qc.call(this,a,0,1,b,c)}x(Sc,Qc);
+Sc.prototype.J=function(){this.show();Sc.i.J.call(this)};var Tc;function Uc(a,b){b?a.setAttribute("role",b):a.removeAttribute("role")}function Vc(a,b,c){ca(c)&&(c=c.join(" "));var d="aria-"+b;""===c||void 0==c?(Tc||(Tc={atomic:!1,autocomplete:"none",dropeffect:"none",haspopup:!1,live:"off",multiline:!1,multiselectable:!1,orientation:"vertical",readonly:!1,relevant:"additions text",required:!1,sort:"none",busy:!1,disabled:!1,hidden:!1,invalid:"false"}),c=Tc,b in c?a.setAttribute(d,c[b]):a.removeAttribute(d)):a.setAttribute(d,c)}
+function Wc(a,b){var c="";b&&(c=b.id);Vc(a,"activedescendant",c)};var Xc=!!m.DOMTokenList,Yc=Xc?function(a){return a.classList}:function(a){a=a.className;return t(a)&&a.match(/\S+/g)||[]},Zc=Xc?function(a,b){return a.classList.contains(b)}:function(a,b){return La(Yc(a),b)},$c=Xc?function(a,b){a.classList.add(b)}:function(a,b){Zc(a,b)||(a.className+=0<a.className.length?" "+b:b)},ad=Xc?function(a,b){Ia(b,function(b){$c(a,b)})}:function(a,b){var c={};Ia(Yc(a),function(a){c[a]=!0});Ia(b,function(a){c[a]=!0});a.className="";for(var d in c)a.className+=0<a.className.length?
+" "+d:d},bd=Xc?function(a,b){a.classList.remove(b)}:function(a,b){Zc(a,b)&&(a.className=Ja(Yc(a),function(a){return a!=b}).join(" "))},cd=Xc?function(a,b){Ia(b,function(b){bd(a,b)})}:function(a,b){a.className=Ja(Yc(a),function(a){return!La(b,a)}).join(" ")};function Z(){}Z.Ma=function(){return Z.Ta?Z.Ta:Z.Ta=new Z};Z.prototype.Ya=0;function dd(a,b,c,d){Q.call(this);this.Ca=a||document.body;this.w=T(this.Ca);this.Hb=!a;this.b=null;this.q="";this.c=[];this.L=[];this.kb=this.ga=-1;this.t=!1;this.className="ac-renderer";this.Ea="ac-row";this.Va="active";this.Ha="ac-active";this.Cb="ac-highlighted";this.ea=b||null;this.Qb=null!=d?d:!0;this.Eb=!0;this.ua=!1;this.Ib=!!c;this.na=!1;this.ka=0;this.jb=!1}x(dd,Q);k=dd.prototype;k.Da=function(a,b,c){this.q=b;this.c=a;this.ga=-1;this.kb=w();this.g=c;this.L=[];ed(this)};
+k.u=function(){this.g&&Wc(this.g,null);this.t&&(this.t=!1,this.g&&Vc(this.g,"haspopup",!1),0<this.ka?(mb(this.M),this.M=new Rc(this.b,this.ka),this.M.play()):this.b.style.display="none")};k.show=function(){this.t||(this.t=!0,this.g&&(Uc(this.g,"combobox"),Vc(this.g,"autocomplete","list"),Vc(this.g,"haspopup",!0)),0<this.ka?(mb(this.M),this.M=new Sc(this.b,this.ka),this.M.play()):this.b.style.display="")};
+function fd(a,b){var c=0<=b&&b<a.c.length?a.c[b]:void 0,d=0<=b&&b<a.L.length?a.L[b]:void 0;if(a.dispatchEvent({type:"rowhilite",Xb:d,U:c?c.data:null})&&(0<=a.ga&&cd(a.L[a.ga],[a.Ha,a.Va]),a.ga=b,d)){ad(d,[a.Ha,a.Va]);a.g&&Wc(a.g,d);var c=a.b,e=X(d),f=X(c),g=Ac(c),h=e.x-f.x-g.left,e=e.y-f.y-g.top,f=c.clientHeight-d.offsetHeight,g=c.scrollLeft,l=c.scrollTop,g=g+Math.min(h,Math.max(h-(c.clientWidth-d.offsetWidth),0)),l=l+Math.min(e,Math.max(e-f,0)),d=new R(g,l);c.scrollLeft=d.x;c.scrollTop=d.y}}
+k.A=function(a){if(-1==a)fd(this,-1);else for(var b=0;b<this.c.length;b++)if(this.c[b].id==a){fd(this,b);break}};function gd(a){if(!a.b){var b=a.w.Ja("div",{style:"display:none"});a.jb&&(b.style.overflowY="auto");a.b=b;ad(b,ma(a.className).split(" "));Uc(b,"listbox");b.id=":"+(Z.Ma().Ya++).toString(36);a.w.appendChild(a.Ca,b);O(b,"click",a.Na,!1,a);O(b,"mousedown",a.Pa,!1,a);O(b,"mouseover",a.Qa,!1,a)}}
+function ed(a){gd(a);a.na&&(a.b.style.visibility="hidden");a.Sb&&(a.b.style.minWidth=a.Sb.clientWidth+"px");a.L.length=0;mc(a.b);if(!a.ea||!a.ea.Vb){var b=null;Ia(a.c,function(a){var d=this.q,e=this.w.Ja("div",{className:this.Ea,id:":"+(Z.Ma().Ya++).toString(36)});Uc(e,"option");this.ea&&this.ea.Wb||(e.innerHTML=na(a.data.toString()));d&&this.Qb&&hd(this,e,d);$c(e,this.Ea);this.L.push(e);a=e;this.na?this.b.insertBefore(a,b):this.w.appendChild(this.b,a);b=a},a)}0==a.c.length?a.u():(a.show(),id(a),
+vc(a.b))}
+function id(a){if(a.g&&a.Hb){var b=a.qb||a.g,c,d=a.Ib?3:1;a.na&&(d^=1);c=d;var e=65;a.jb&&(a.b.style.height="",e|=32);var d=a.b,f=c^1,g,h;if(g=d.offsetParent){var l="HTML"==g.tagName||"BODY"==g.tagName;l&&"static"==W(g,"position")||(h=X(g),l||(l=(l=qc(g))&&F?-g.scrollLeft:!l||E&&H("8")||"visible"==W(g,"overflowX")?g.scrollLeft:g.scrollWidth-g.clientWidth-g.scrollLeft,h=Yb(h,new R(l,g.scrollTop))))}g=h||new R;h=X(b);l=sc(b);h=new $b(h.x,h.y,l.width,l.height);if(l=pc(b)){var r=new $b(l.left,l.top,l.right-
+l.left,l.bottom-l.top),l=Math.max(h.left,r.left),p=Math.min(h.left+h.width,r.left+r.width);if(l<=p){var s=Math.max(h.top,r.top),r=Math.min(h.top+h.height,r.top+r.height);s<=r&&(h.left=l,h.top=s,h.width=p-l,h.height=r-s)}}l=T(b);s=T(d);if(l.l!=s.l){var p=l.l.body,s=ic(s.l),r=new R(0,0),y;y=(y=U(p))?ic(y):window;var N=p;do{var C;if(y==s)C=X(N);else{C=N;var J=void 0;if(C.getBoundingClientRect)J=nc(C),J=new R(J.left,J.top);else var J=lc(T(C)),v=X(C),J=new R(v.x-J.x,v.y-J.y);v=void 0;if(F&&!H(12)){v=void 0;
+v=void 0;E?v="-ms-transform":G?v="-webkit-transform":D?v="-o-transform":F&&(v="-moz-transform");var ya=void 0;v&&(ya=W(C,v));ya||(ya=W(C,"transform"));v=ya?(C=ya.match(Bc))?new R(parseFloat(C[1]),parseFloat(C[2])):new R(0,0):new R(0,0);v=new R(J.x+v.x,J.y+v.y)}else v=J;C=v}r.x+=C.x;r.y+=C.y}while(y&&y!=s&&(N=y.frameElement)&&(y=y.parent));p=Yb(r,X(p));E&&!kc(l)&&(p=Yb(p,lc(l)));h.left+=p.x;h.top+=p.y}var b=Cc(b,c),b=new R(b&2?h.left+h.width:h.left,b&1?h.top+h.height:h.top),b=Yb(b,g),n;e&&(n=pc(d))&&
+(n.top-=g.y,n.right-=g.x,n.bottom-=g.y,n.left-=g.x);a:{c=n;b=b.W();g=Cc(d,f);n=sc(d);f=n.W();0!=g&&(g&2&&(b.x-=f.width+0),g&1&&(b.y-=f.height+0));if(e&&(c?(g=b,h=0,65==(e&65)&&(g.x<c.left||g.x>=c.right)&&(e&=-2),132==(e&132)&&(g.y<c.top||g.y>=c.bottom)&&(e&=-5),g.x<c.left&&e&1&&(g.x=c.left,h|=1),g.x<c.left&&g.x+f.width>c.right&&e&16&&(f.width=Math.max(f.width-(g.x+f.width-c.right),0),h|=4),g.x+f.width>c.right&&e&1&&(g.x=Math.max(c.right-f.width,c.left),h|=1),e&2&&(h=h|(g.x<c.left?16:0)|(g.x+f.width>
+c.right?32:0)),g.y<c.top&&e&4&&(g.y=c.top,h|=2),g.y<=c.top&&g.y+f.height<c.bottom&&e&32&&(f.height=Math.max(f.height-(c.top-g.y),0),g.y=c.top,h|=8),g.y>=c.top&&g.y+f.height>c.bottom&&e&32&&(f.height=Math.max(f.height-(g.y+f.height-c.bottom),0),h|=8),g.y+f.height>c.bottom&&e&4&&(g.y=Math.max(c.bottom-f.height,c.top),h|=2),e&8&&(h=h|(g.y<c.top?64:0)|(g.y+f.height>c.bottom?128:0)),e=h):e=256,e&496))break a;c=b;b=F&&(B||Za)&&H("1.9");c instanceof R?(e=c.x,c=c.y):(e=c,c=void 0);d.style.left=rc(e,b);d.style.top=
+rc(c,b);n==f||n&&f&&n.width==f.width&&n.height==f.height||(n=kc(T(U(d))),!E||n&&H("8")?(d=d.style,F?d.MozBoxSizing="border-box":G?d.WebkitBoxSizing="border-box":d.boxSizing="border-box",d.width=Math.max(f.width,0)+"px",d.height=Math.max(f.height,0)+"px"):(e=d.style,n?(E?(n=xc(d,"paddingLeft"),b=xc(d,"paddingRight"),c=xc(d,"paddingTop"),g=xc(d,"paddingBottom"),n=new S(c,b,g,n)):(n=V(d,"paddingLeft"),b=V(d,"paddingRight"),c=V(d,"paddingTop"),g=V(d,"paddingBottom"),n=new S(parseFloat(c),parseFloat(b),
+parseFloat(g),parseFloat(n))),d=Ac(d),e.pixelWidth=f.width-d.left-n.left-n.right-d.right,e.pixelHeight=f.height-d.top-n.top-n.bottom-d.bottom):(e.pixelWidth=f.width,e.pixelHeight=f.height)))}a.na&&(a.b.style.visibility="visible")}}k.e=function(){this.b&&(vb(this.b,"click",this.Na,!1,this),vb(this.b,"mousedown",this.Pa,!1,this),vb(this.b,"mouseover",this.Qa,!1,this),this.w.removeNode(this.b),this.b=null,this.t=!1);mb(this.M);this.Ca=null;dd.i.e.call(this)};
+function hd(a,b,c){if(3==b.nodeType){var d=null;q(c)&&1<c.length&&!a.ua&&(d=Na(c,1));c=jd(a,c);if(0!=c.length){var e=b.nodeValue,f=a.Eb?RegExp("\\b(?:"+c+")","gi"):RegExp(c,"gi");c=[];for(var g=0,h=f.exec(e),l=0;h;)l++,c.push(e.substring(g,h.index)),c.push(e.substring(h.index,f.lastIndex)),g=f.lastIndex,h=f.exec(e);c.push(e.substring(g));if(1<c.length){d=a.ua?l:1;for(e=0;e<d;e++)f=2*e,b.nodeValue=c[f],g=a.w.createElement("b"),g.className=a.Cb,a.w.appendChild(g,a.w.createTextNode(c[f+1])),g=b.parentNode.insertBefore(g,
+b.nextSibling),b.parentNode.insertBefore(a.w.createTextNode(""),g.nextSibling),b=g.nextSibling;a=Na(c,2*d);b.nodeValue=a.join("")}else d&&hd(a,b,d)}}else for(b=b.firstChild;b;)d=b.nextSibling,hd(a,b,c),b=d}
+function jd(a,b){var c="";if(!b)return c;q(b)&&(b=Ja(b,function(a){return!/^[\s\xa0]*$/.test(null==a?"":String(a))}));a.ua?q(b)?c=Ka(b,ua).join("|"):(c=b.replace(/[\s\xa0]+/g," ").replace(/^\s+|\s+$/g,""),c=ua(c),c=c.replace(/ /g,"|")):q(b)?c=0<b.length?ua(b[0]):"":/^\W/.test(b)||(c=ua(b));return c}function kd(a,b){for(;b&&b!=a.b&&!Zc(b,a.Ea);)b=b.parentNode;return b?Ha(a.L,b):-1}k.Na=function(a){var b=kd(this,a.target);0<=b&&this.dispatchEvent({type:Cb,U:this.c[b].id});a.stopPropagation()};
+k.Pa=function(a){a.stopPropagation();a.preventDefault()};k.Qa=function(a){a=kd(this,a.target);0<=a&&!(300>w()-this.kb)&&this.dispatchEvent({type:Bb,U:this.c[a].id})};function ld(a){K.call(this);this.Y=a;this.ja={}}x(ld,K);var md=[];k=ld.prototype;k.o=function(a,b,c,d){q(b)||(md[0]=b,b=md);for(var e=0;e<b.length;e++){var f=O(a,b[e],c||this.handleEvent,d||!1,this.Y||this);if(!f)break;this.ja[f.key]=f}return this};k.s=function(a,b,c,d,e){if(q(b))for(var f=0;f<b.length;f++)this.s(a,b[f],c,d,e);else c=c||this.handleEvent,e=e||this.Y||this,c=rb(c),d=!!d,b=xa(a)?a.X(b,c,d,e):a?(a=sb(a))?a.X(b,c,d,e):null:null,b&&(P(b),delete this.ja[b.key]);return this};
+k.ma=function(){Ca(this.ja,P);this.ja={}};k.e=function(){ld.i.e.call(this);this.ma()};k.handleEvent=function(){throw Error("EventHandler.handleEvent not implemented");};function Mb(a){var b;a:{var c=0,d=0;if(Ob(a))c=a.selectionStart,d=-1;else if(E){var e=Pb(a);b=e[0];e=e[1];if(b.inRange(e)){b.setEndPoint("EndToStart",e);if("textarea"==a.type){e.duplicate();c=a=b.text;for(d=!1;!d;)0==b.compareEndPoints("StartToEnd",b)?d=!0:(b.moveEnd("character",-1),b.text==a?c+="\r\n":d=!0);b=[c.length,-1];break a}c=b.text.length;d=-1}}b=[c,d]}return b[0]}
+function Pb(a){var b=a.ownerDocument||a.document,c=b.selection.createRange();"textarea"==a.type?(b=b.body.createTextRange(),b.moveToElementText(a)):b=a.createTextRange();return[b,c]}function Qb(a,b){"textarea"==a.type&&(b=a.value.substring(0,b).replace(/(\r\n|\r|\n)/g,"\n").length);return b}function Ob(a){try{return"number"==typeof a.selectionStart}catch(b){return!1}};var nd,od;od=nd=!1;var pd=Ua();pd&&(-1!=pd.indexOf("Firefox")||-1!=pd.indexOf("Camino")||(-1!=pd.indexOf("iPhone")||-1!=pd.indexOf("iPod")?nd=!0:-1!=pd.indexOf("iPad")&&(od=!0)));var qd=nd,rd=od;function sd(a,b,c,d,e){if(!(E||G&&H("525")))return!0;if(B&&e)return td(a);if(e&&!d)return!1;da(b)&&(b=ud(b));if(!c&&(17==b||18==b||B&&91==b))return!1;if(G&&d&&c)switch(a){case 220:case 219:case 221:case 192:case 186:case 189:case 187:case 188:case 190:case 191:case 192:case 222:return!1}if(E&&d&&b==a)return!1;switch(a){case 13:return!(E&&E&&9<=I);case 27:return!G}return td(a)}
+function td(a){if(48<=a&&57>=a||96<=a&&106>=a||65<=a&&90>=a||G&&0==a)return!0;switch(a){case 32:case 63:case 107:case 109:case 110:case 111:case 186:case 59:case 189:case 187:case 61:case 188:case 190:case 191:case 192:case 222:case 219:case 220:case 221:return!0;default:return!1}}function ud(a){if(F)a=vd(a);else if(B&&G)a:switch(a){case 93:a=91;break a}return a}
+function vd(a){switch(a){case 61:return 187;case 59:return 186;case 173:return 189;case 224:return 91;case 0:return 224;default:return a}};function wd(a,b){Q.call(this);a&&xd(this,a,b)}x(wd,Q);k=wd.prototype;k.b=null;k.ha=null;k.wa=null;k.ia=null;k.m=-1;k.F=-1;k.ra=!1;
+var yd={3:13,12:144,63232:38,63233:40,63234:37,63235:39,63236:112,63237:113,63238:114,63239:115,63240:116,63241:117,63242:118,63243:119,63244:120,63245:121,63246:122,63247:123,63248:44,63272:46,63273:36,63275:35,63276:33,63277:34,63289:144,63302:45},zd={Up:38,Down:40,Left:37,Right:39,Enter:13,F1:112,F2:113,F3:114,F4:115,F5:116,F6:117,F7:118,F8:119,F9:120,F10:121,F11:122,F12:123,"U+007F":46,Home:36,End:35,PageUp:33,PageDown:34,Insert:45},Ad=E||G&&H("525"),Bd=B&&F;k=wd.prototype;
+k.zb=function(a){G&&(17==this.m&&!a.ctrlKey||18==this.m&&!a.altKey||B&&91==this.m&&!a.metaKey)&&(this.F=this.m=-1);-1==this.m&&(a.ctrlKey&&17!=a.keyCode?this.m=17:a.altKey&&18!=a.keyCode?this.m=18:a.metaKey&&91!=a.keyCode&&(this.m=91));Ad&&!sd(a.keyCode,this.m,a.shiftKey,a.ctrlKey,a.altKey)?this.handleEvent(a):(this.F=ud(a.keyCode),Bd&&(this.ra=a.altKey))};k.Bb=function(a){this.F=this.m=-1;this.ra=a.altKey};
+k.handleEvent=function(a){var b=a.N,c,d,e=b.altKey;E&&"keypress"==a.type?(c=this.F,d=13!=c&&27!=c?b.keyCode:0):G&&"keypress"==a.type?(c=this.F,d=0<=b.charCode&&63232>b.charCode&&td(c)?b.charCode:0):D?(c=this.F,d=td(c)?b.keyCode:0):(c=b.keyCode||this.F,d=b.charCode||0,Bd&&(e=this.ra),B&&63==d&&224==c&&(c=191));var f=c=ud(c),g=b.keyIdentifier;c?63232<=c&&c in yd?f=yd[c]:25==c&&a.shiftKey&&(f=9):g&&g in zd&&(f=zd[g]);a=f==this.m;this.m=f;b=new Cd(f,d,a,b);b.altKey=e;this.dispatchEvent(b)};
+function xd(a,b,c){a.ia&&a.detach();a.b=b;a.ha=O(a.b,"keypress",a,c);a.wa=O(a.b,"keydown",a.zb,c,a);a.ia=O(a.b,"keyup",a.Bb,c,a)}k.detach=function(){this.ha&&(P(this.ha),P(this.wa),P(this.ia),this.ia=this.wa=this.ha=null);this.b=null;this.F=this.m=-1};k.e=function(){wd.i.e.call(this);this.detach()};function Cd(a,b,c,d){M.call(this,d);this.type="key";this.keyCode=a;this.charCode=b;this.repeat=c}x(Cd,M);function Dd(a,b,c,d){K.call(this);d=d||150;this.R=null!=c?c:!0;this.aa=a||",;";this.tb=this.aa.substring(0,1);a=this.R?"[\\s"+this.aa+"]+":"[\\s]+";this.mb=RegExp("^"+a+"|"+a+"$","g");this.Jb=RegExp("\\s*["+this.aa+"]$");this.Wa=b||"";this.Gb=this.R;this.f=0<d?new Dc(d):null;this.h=new ld(this);this.pa=new ld(this);this.Z=new wd;this.Ua=-1}x(Dd,K);var Ed=(qd||rd)&&!H("533.17.9");k=Dd.prototype;k.Rb=!0;k.wb=!0;k.nb=!1;k.Lb=!0;k.Kb=!0;k.qa=null;k.a=null;k.xa="";k.G=!1;k.Fa=!1;k.Ob=!0;
+k.sa=function(a){for(var b=0;b<arguments.length;b++){var c=arguments[b];fa(c)&&1==c.nodeType&&Vc(c,"haspopup",!0);this.h.o(c,"focus",this.Oa);this.h.o(c,"blur",this.yb);if(!this.a&&(this.pa.o(c,"keydown",this.Fb),fa(c)&&1==c.nodeType)){var d;a:{var e=U(c);try{d=e&&e.activeElement;break a}catch(f){}d=null}d==c&&Fd(this,c)}}};k.e=function(){Dd.i.e.call(this);null!=this.qa&&window.clearTimeout(this.qa);this.h.B();delete this.h;this.pa.B();this.Z.B();mb(this.f)};
+function Gd(a,b){switch(b.keyCode){case 40:if(a.d.p.t){a.nb?Kb(a.d):Jb(a.d);b.preventDefault();return}if(!a.R){a.update(!0);b.preventDefault();return}break;case 38:if(a.d.p.t){a.nb?Jb(a.d):Kb(a.d);b.preventDefault();return}break;case 9:if(a.d.p.t&&!b.shiftKey){if(a.update(),Gb(a.d)&&a.Gb){b.preventDefault();return}}else a.d.u();break;case 13:if(a.d.p.t){if(a.update(),Gb(a.d)){b.preventDefault();b.stopPropagation();return}}else a.d.u();break;case 27:if(a.d.p.t){a.d.u();b.preventDefault();b.stopPropagation();
+return}break;case 229:if(!a.G){a.G||(a.h.o(a.a,"keyup",a.bb),a.h.o(a.a,"keypress",a.ab),a.G=!0);return}break;default:a.f&&!a.Ob&&(a.f.stop(),a.f.start())}Hd(a,b)}function Hd(a,b){var c=a.R&&b.charCode&&-1!=a.aa.indexOf(String.fromCharCode(b.charCode));a.Lb&&c&&a.update();a.Kb&&c&&Gb(a.d)&&b.preventDefault()}k.Ab=function(){return!1};k.Oa=function(a){Fd(this,a.target||null)};
+function Fd(a,b){a.pa.ma();a.d&&Hb(a.d);b!=a.a&&(a.a=b,a.f&&(a.f.start(),a.h.o(a.f,Ec,a.fb)),a.xa=a.a.value,xd(a.Z,a.a),a.h.o(a.Z,"key",a.cb),a.h.o(a.a,"mousedown",a.eb),E&&a.h.o(a.a,"keypress",a.$a))}k.yb=function(){Ed?this.qa=window.setTimeout(u(this.gb,this),0):this.gb()};
+k.gb=function(){this.a&&(this.h.s(this.Z,"key",this.cb),this.Z.detach(),this.h.s(this.a,"keyup",this.Ab),this.h.s(this.a,"mousedown",this.eb),E&&this.h.s(this.a,"keypress",this.$a),this.G&&Id(this),this.a=null,this.f&&(this.f.stop(),this.h.s(this.f,Ec,this.fb)),this.d&&Ib(this.d))};k.fb=function(){this.update()};k.Fb=function(a){this.Oa(a)};k.cb=function(a){this.Ua=a.keyCode;this.d&&Gd(this,a)};k.ab=function(){this.G&&229!=this.Ua&&Id(this)};
+k.bb=function(a){this.G&&(13==a.keyCode||77==a.keyCode&&a.ctrlKey)&&Id(this)};k.eb=function(){};function Id(a){a.G&&(a.G=!1,a.h.s(a.a,"keypress",a.ab),a.h.s(a.a,"keyup",a.bb))}k.$a=function(a){Hd(this,a)};
+k.update=function(a){if(this.a&&(a||this.a.value!=this.xa)){if(a||!this.Fa){var b;a=Mb(this.a);b=this.a.value;a=Nb(this,b)[Lb(this,b,a)];b=this.mb?String(a).replace(this.mb,""):a;if(this.d&&(this.d.g=this.a,a=this.d,a.q!=b)){a.q=b;var c=a.Q;b=a.q;var d=a.Xa,e=u(a.Db,a);if(c.Pb){var c=c.c,f=Wb(b,d,c);0==f.length&&(f=Xb(b,d,c));d=f}else d=Wb(b,d,c.c);e(b,d);Hb(a)}}this.xa=this.a.value}this.Fa=!1};
+function Lb(a,b,c){a=Nb(a,b);if(c==b.length)return a.length-1;for(var d=b=0,e=0;d<a.length&&e<=c;d++)e+=a[d].length,b=d;return b}function Nb(a,b){if(!a.R)return[b];for(var c=String(b).split(""),d=[],e=[],f=0,g=!1;f<c.length;f++)a.Wa&&-1!=a.Wa.indexOf(c[f])?(a.wb&&!g&&(d.push(e.join("")),e.length=0),e.push(c[f]),g=!g):g||-1==a.aa.indexOf(c[f])?e.push(c[f]):(e.push(c[f]),d.push(e.join("")),e.length=0);d.push(e.join(""));return d};function Jd(a,b){var c=new Vb(a),d=new dd,e=new Dd(null,null,!1),c=new Ab(c,d,e);e.d=c;e.sa(b);return c};function Kd(){var a=cc("search"),b=cc("go"),c=window.jvXRef,d=window.jvBaseDir,e=[],f;for(f in c)e.push(f);e=Jd(e,a);e.Xa=20;O(e,"update",function(){b.click()});O(a,"keydown",function(a){13==a.keyCode&&setTimeout(function(){b.click()},1)});O(b,"click",function(){var b=a.value,e=c[b];e?window.location.href=d+"/"+e:alert("unknown symbol "+b);return!0});e=new wd(document);O(e,"key",function(b){b.target==a||102!==b.charCode||b.altKey||b.ctrlKey||b.metaKey||(a.focus(),a.select(),b.preventDefault())});
+Tb(a.parentElement,"off")}function Ld(){function a(a){La(Rb(a),"hidden")?Tb(a,"hidden"):Sb(a,"hidden")}for(var b=dc(),c=0;c<b.length;++c){var d=b[c];O(d.firstChild,"click",u(a,void 0,d))}}function Md(){Kd();Ld()}var Nd=["init"],$=m;Nd[0]in $||!$.execScript||$.execScript("var "+Nd[0]);for(var Od;Nd.length&&(Od=Nd.shift());)Nd.length||void 0===Md?$=$[Od]?$[Od]:$[Od]={}:$[Od]=Md;
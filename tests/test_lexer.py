@@ -0,0 +1,144 @@
+# Copyright (C) 2011  Jochen Voss <voss@seehuhn.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Tests for the lexical analysis in `scan_source()`."""
+
+import time
+
+import pytest
+
+# Inputs of up to a few megabytes must be read within this many
+# seconds.  The limit is far above the actual running time, but far
+# below the minutes a quadratic scan takes on these inputs.
+TIME_LIMIT = 5.0
+
+def test_plain_comments(jvjsdoc):
+    code, docs, unclosed = jvjsdoc.scan_source(
+        "/* a */ x = 1; // b\n/** doc */\ny = 2;\n")
+    assert code == " x = 1; \n\ny = 2;\n"
+    assert docs == [ (' doc ', "\ny = 2;\n") ]
+    assert not unclosed
+
+def test_empty_comment_is_not_doc(jvjsdoc):
+    code, docs, unclosed = jvjsdoc.scan_source("/**/ x = 1;\n")
+    assert code == " x = 1;\n"
+    assert docs == []
+
+@pytest.mark.parametrize('literal', [
+    "'http://example.com/'",
+    '"http://example.com/"',
+    "`http://example.com/`",
+    "'/*'",
+    '"/* not a comment */"',
+    "'*/'",
+    "'it\\'s // not a comment'",
+    "'/**'",
+])
+def test_comment_delimiters_in_strings(jvjsdoc, literal):
+    source = "/** doc */\nx.y = %s;\n/** more */\nx.z = 1;\n" % literal
+    code, docs, unclosed = jvjsdoc.scan_source(source)
+    assert code == "\nx.y = %s;\n\nx.z = 1;\n" % literal
+    assert docs == [ (' doc ', "\nx.y = %s;\n" % literal),
+                     (' more ', "\nx.z = 1;\n") ]
+    assert not unclosed
+
+@pytest.mark.parametrize('regexp', [
+    r"/\/*/",
+    r"/[/*]/g",
+    r"/a\/\/b/",
+    r"/http:\/\//",
+    r"/\/**/",
+])
+def test_comment_delimiters_in_regexps(jvjsdoc, regexp):
+    source = "/** doc */\nx.y = %s;\n/** more */\nx.z = 1;\n" % regexp
+    code, docs, unclosed = jvjsdoc.scan_source(source)
+    assert code == "\nx.y = %s;\n\nx.z = 1;\n" % regexp
+    assert [ comment for comment, _ in docs ] == [ ' doc ', ' more ' ]
+
+@pytest.mark.parametrize('source', [
+    "x = a / b; /** doc */ y = 1;",
+    "x = a[0] / b / c; /** doc */ y = 1;",
+    "x = f(a) / 2 /** doc */ y = 1;",
+    "x = a /* c */ / b; /** doc */ y = 1;",
+])
+def test_division_is_not_regexp(jvjsdoc, source):
+    code, docs, unclosed = jvjsdoc.scan_source(source)
+    assert [ comment for comment, _ in docs ] == [ ' doc ' ]
+
+@pytest.mark.parametrize('source', [
+    "return /** doc */ 1;",
+    "x = typeof /a/ /** doc */;",
+])
+def test_regexp_after_keyword(jvjsdoc, source):
+    code, docs, unclosed = jvjsdoc.scan_source(source)
+    assert [ comment for comment, _ in docs ] == [ ' doc ' ]
+
+def test_doc_in_line_comment(jvjsdoc):
+    code, docs, unclosed = jvjsdoc.scan_source(
+        "x = 1; // /** not a doc */\n")
+    assert code == "x = 1; \n"
+    assert docs == []
+
+def test_unclosed_doc(jvjsdoc):
+    code, docs, unclosed = jvjsdoc.scan_source(
+        "/** doc */\nx.y = 1;\n/** never closed\n")
+    assert docs == [ (' doc ', "\nx.y = 1;\n") ]
+    assert unclosed
+
+def test_unclosed_plain_comment(jvjsdoc):
+    code, docs, unclosed = jvjsdoc.scan_source("x = 1;\n/* never closed\n")
+    assert code == "x = 1;\n"
+    assert not unclosed
+
+######################################################################
+# adversarial inputs
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    assert elapsed < TIME_LIMIT, "took %.1fs" % elapsed
+    return result
+
+def _read_file(jvjsdoc, tmp_path, body):
+    fname = tmp_path / 'test.js'
+    fname.write_text(body)
+    return _timed(jvjsdoc.JsFile.from_source, str(fname))
+
+def test_many_comment_starts_in_strings(jvjsdoc):
+    source = "var s = '/*';\n" * 20000
+    code, docs, unclosed = _timed(jvjsdoc.scan_source, source)
+    assert code == source
+    assert docs == []
+
+def test_many_slashes_in_strings(jvjsdoc, tmp_path):
+    body = "/** doc */\nx.y = 'http://a/*b//c';\n" * 10000
+    jsfile = _read_file(jvjsdoc, tmp_path, body)
+    assert len(jsfile.symbols) == 10000
+
+def test_minified(jvjsdoc):
+    source = "a=b/c;d=e.f(/x[/]y/g,'//');" * 80000
+    assert len(source) > 2 * 2**20
+    code, docs, unclosed = _timed(jvjsdoc.scan_source, source)
+    assert code == source
+
+def test_failing_regexps(jvjsdoc):
+    source = "x = (/[" * 40000
+    code, docs, unclosed = _timed(jvjsdoc.scan_source, source)
+    assert code == source
+
+def test_many_unclosed_docs(jvjsdoc, tmp_path):
+    body = "/** a */ x.y = 1;\n" + "/**/" * 15000 + "/** never closed"
+    jsfile = _read_file(jvjsdoc, tmp_path, body)
+    assert [ sym[0] for sym in jsfile.symbols ] == [ 'x.y' ]
+
+def test_blank_lines_in_enum(jvjsdoc, tmp_path):
+    body = ("/** @enum {number} */\nx.E = {\n  A: 1,"
+            + "\n" * 200000 + "  B: 2\n};\n")
+    jsfile = _read_file(jvjsdoc, tmp_path, body)
+    names = [ sym[0] for sym in jsfile.symbols ]
+    assert 'x.E.A' in names and 'x.E.B' in names
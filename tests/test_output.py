@@ -0,0 +1,274 @@
+# Copyright (C) 2011  Jochen Voss <voss@seehuhn.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""End-to-end tests, comparing the generated files to stored copies.
+
+The files in tests/golden/ are the output for the sources in
+tests/corpus/.  After an intended change of the output, run the tests
+with JVJSDOC_UPDATE_GOLDEN=1 set to replace the stored copies, and
+review the differences before committing them.
+
+tests/throughput.json records the files/s and pages/s measured for a
+generated corpus.  The figures depend on the machine: after moving the
+tests to a different machine, or after an intended change of speed,
+JVJSDOC_UPDATE_GOLDEN=1 also replaces this baseline.
+"""
+
+import gzip
+import json
+import os
+import os.path
+import re
+import shutil
+import subprocess
+import sys
+
+from conftest import TOP_DIR, SCRIPT
+
+CORPUS = os.path.join(TOP_DIR, 'tests', 'corpus')
+GOLDEN = os.path.join(TOP_DIR, 'tests', 'golden')
+BASELINE = os.path.join(TOP_DIR, 'tests', 'throughput.json')
+
+# The throughput is measured for a generated corpus of
+# `THROUGHPUT_FILES` files, taking the best of `THROUGHPUT_RUNS` runs.
+# On a busy machine single runs vary by up to a factor of two, while
+# the best of five stays within about 30% of the baseline, so a
+# slowdown by more than `THROUGHPUT_TOLERANCE` compared to the
+# baseline fails the test.
+THROUGHPUT_FILES = 400
+THROUGHPUT_RUNS = 5
+THROUGHPUT_TOLERANCE = 0.4
+
+def run_jvjsdoc(*argv):
+    """Run jvjsdoc.py with a fixed build date."""
+    env = dict(os.environ, SOURCE_DATE_EPOCH='0')
+    return subprocess.run([ sys.executable, SCRIPT ] + list(argv),
+                          cwd=TOP_DIR, env=env, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, universal_newlines=True)
+
+def run(*argv):
+    """Run jvjsdoc.py, check that it succeeds and return stderr."""
+    proc = run_jvjsdoc(*argv)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stderr
+
+def list_files(root):
+    res = []
+    for path, dirs, files in os.walk(root):
+        for fname in files:
+            res.append(os.path.relpath(os.path.join(path, fname), root))
+    return sorted(res)
+
+def compare_trees(output):
+    if os.environ.get('JVJSDOC_UPDATE_GOLDEN'):
+        shutil.rmtree(GOLDEN, ignore_errors=True)
+        shutil.copytree(output, GOLDEN)
+    assert list_files(output) == list_files(GOLDEN)
+    for fname in list_files(GOLDEN):
+        expected = open(os.path.join(GOLDEN, fname), 'rb').read()
+        got = open(os.path.join(output, fname), 'rb').read()
+        assert got == expected, fname + " differs"
+
+def test_golden(tmp_path):
+    output = str(tmp_path / 'out')
+    messages = run('-o', output, CORPUS)
+    compare_trees(output)
+    assert 'error: dependency loop detected' in messages
+    assert 'error: multiple definitions for loop.A.f' in messages
+
+def test_golden_low_memory(tmp_path):
+    output = str(tmp_path / 'out')
+    run('--low-memory', '-o', output, CORPUS)
+    compare_trees(output)
+
+def test_golden_sharded(tmp_path):
+    shards = str(tmp_path / 'shards')
+    output = str(tmp_path / 'out')
+    for k in range(1, 4):
+        run('--shard', '%d/3' % k, '--low-memory', '-o', shards, CORPUS)
+    run('--merge', '-o', output, shards)
+    compare_trees(output)
+
+def test_gzip(tmp_path):
+    output = str(tmp_path / 'out')
+    run('-z', '--gzip-level', '1', '--gzip-min-size', '2000', '-o', output,
+        CORPUS)
+    files = list_files(output)
+    compressed = [ fname for fname in files if fname.endswith('.gz') ]
+    assert 'jsdoc.js.gz' in compressed
+    for fname in files:
+        if fname.endswith('.gz') or fname == 'jvjsdoc-gzip-level':
+            continue
+        full = os.path.join(output, fname)
+        if os.path.getsize(full) < 2000:
+            assert fname + '.gz' not in compressed
+        else:
+            data = gzip.open(full + '.gz').read()
+            assert data == open(full, 'rb').read()
+
+    # the XFL byte of the gzip header is 4 for level 1 and 2 for level 9
+    gz_full = os.path.join(output, 'jsdoc.js.gz')
+    assert open(gz_full, 'rb').read()[8] == 4
+    run('-z', '--gzip-min-size', '2000', '-o', output, CORPUS)
+    assert open(gz_full, 'rb').read()[8] == 2
+
+    run('-o', output, CORPUS)
+    assert [ fname for fname in list_files(output)
+             if fname.endswith('.gz') ] == []
+    assert list_files(output) == list_files(GOLDEN)
+
+def test_only(tmp_path):
+    output = str(tmp_path / 'out')
+    messages = run('--only', 'team.Button', '-o', output, CORPUS)
+    assert list_files(output) == [ 'index-team.html', 'index.html',
+                                   'index.js', 'jsdoc.css', 'jsdoc.js',
+                                   'team/Button.html' ]
+    # the files for loop.A are not read
+    assert 'dependency loop' not in messages
+    page = open(os.path.join(output, 'team', 'Button.html')).read()
+    expected = open(os.path.join(GOLDEN, 'team', 'Button.html')).read()
+    assert page == expected
+    # @inheritDoc from base.Thing, and a method inherited from team.Widget
+    assert '<p>Do it.\n' in page
+    assert 'Inherited from <a href="Widget.html">' in page
+    index = open(os.path.join(output, 'index.js')).read()
+    assert 'team.Widget' not in index and 'base.Thing' not in index
+
+def test_only_unknown(tmp_path):
+    output = str(tmp_path / 'out')
+    proc = run_jvjsdoc('--only', 'team.Buton', '-o', output, CORPUS)
+    assert proc.returncode == 1
+    assert 'error: no file provides the namespace team.Buton' in proc.stderr
+    assert not os.path.exists(output)
+
+def test_emit_json(tmp_path):
+    proc = run_jvjsdoc('--emit-json', '-', '-v', '-o', str(tmp_path / 'out'),
+                       CORPUS)
+    assert proc.returncode == 0, proc.stderr
+    records = {}
+    for line in proc.stdout.splitlines():
+        record = json.loads(line)
+        records[record['name']] = record
+    assert 'writing ' in proc.stderr
+    assert records['team.Button.label'] == {
+        'name': 'team.Button.label',
+        'kind': 'function',
+        'params': [
+            { 'name': 'prefix', 'type': 'string',
+              'desc': 'Text to put in front.' },
+            { 'name': 'width', 'type': 'number=',
+              'desc': 'The maximal width.' },
+        ],
+        'return': { 'type': 'string', 'desc': 'The label.' },
+        'super': None,
+        'deprecated': None,
+        'private': False,
+        'provided_by': None,
+        'url': 'team/Button.html#label',
+    }
+    assert records['team.Button']['super'] == 'team.Widget'
+    assert records['team.Button.press']['deprecated'] == 'Use click() instead.'
+    assert 'foo.util.helper_' in records
+
+def test_report_slowest(tmp_path):
+    messages = run('--report-slowest', '2', '-o', str(tmp_path / 'out'),
+                   CORPUS)
+    files = messages.split('slowest source files:\n')[1].split('slowest')[0]
+    assert len(files.splitlines()) == 2
+    for argv in [ ('--report-slowest', '-2', '-o', str(tmp_path), CORPUS),
+                  ('--merge', '--report-csv', str(tmp_path / 'costs.csv'),
+                   '-o', str(tmp_path), CORPUS) ]:
+        proc = run_jvjsdoc(*argv)
+        assert proc.returncode == 2
+
+def write_corpus(root, nfiles):
+    """Generate `nfiles` source files with classes, methods and enums."""
+    for i in range(nfiles):
+        ns = 'lib%d.mod%d' % (i % 20, i)
+        sup = 'lib%d.mod%d.Cls' % ((i-1) % 20, i-1) if i % 5 else None
+        out = [ "goog.provide('%s.Cls');" % ns,
+                "goog.provide('%s.util');" % ns ]
+        if sup:
+            out.append("goog.require('%s');" % sup)
+        out.append('/**\n * Class number %d.  Some text.\n * @constructor\n'
+                   '%s */\n%s.Cls = function() {\n'
+                   '  /**\n   * A field.\n   * @type {string}\n   */\n'
+                   '  this.field = "http://x/*y";\n};'
+                   % (i, ' * @extends {%s}\n' % sup if sup else '', ns))
+        for m in range(20):
+            tag = ' * @override\n' if sup and m % 3 == 0 else ''
+            out.append('/**\n * Method %d.  More text.\n'
+                       ' * @param {number} x The x.\n%s'
+                       ' * @return {string} The result.\n */\n'
+                       '%s.Cls.prototype.meth%d = function(x) {\n'
+                       '  return "a//b" + x;\n};' % (m, tag, ns, m))
+        out.append('/**\n * Colours.\n * @enum {string}\n */\n'
+                   '%s.util.Colour = {\n  RED: "r",\n  GREEN: "g"\n};' % ns)
+        path = os.path.join(root, 'lib%d' % (i % 20))
+        os.makedirs(path, exist_ok=True)
+        fd = open(os.path.join(path, 'mod%d.js' % i), 'w')
+        fd.write('\n\n'.join(out) + '\n')
+        fd.close()
+
+def measure_throughput(source, output):
+    """Run jvjsdoc.py with -v and return the files/s and pages/s."""
+    messages = run('-v', '-o', output, source)
+    m = re.search(r'^read (\d+) files in [\d.]+s \(([\d.]+) files/s\)$',
+                  messages, re.M)
+    assert m, messages
+    assert int(m.group(1)) == THROUGHPUT_FILES
+    files_per_sec = float(m.group(2))
+    m = re.search(r'^wrote (\d+) pages in [\d.]+s \(([\d.]+) pages/s\)$',
+                  messages, re.M)
+    assert m, messages
+    return files_per_sec, float(m.group(2))
+
+def test_throughput(tmp_path):
+    source = str(tmp_path / 'src')
+    write_corpus(source, THROUGHPUT_FILES)
+    best_files, best_pages = 0, 0
+    for k in range(THROUGHPUT_RUNS):
+        files_per_sec, pages_per_sec = measure_throughput(
+            source, str(tmp_path / ('out%d' % k)))
+        best_files = max(best_files, files_per_sec)
+        best_pages = max(best_pages, pages_per_sec)
+    if os.environ.get('JVJSDOC_UPDATE_GOLDEN'):
+        fd = open(BASELINE, 'w')
+        json.dump({ 'files': THROUGHPUT_FILES,
+                    'files_per_sec': round(best_files),
+                    'pages_per_sec': round(best_pages) },
+                  fd, indent=2, sort_keys=True)
+        fd.write('\n')
+        fd.close()
+    baseline = json.load(open(BASELINE))
+    assert baseline['files'] == THROUGHPUT_FILES
+    floor = 1 - THROUGHPUT_TOLERANCE
+    assert best_files >= floor * baseline['files_per_sec'], \
+        "%.0f files/s, baseline %d" % (best_files, baseline['files_per_sec'])
+    assert best_pages >= floor * baseline['pages_per_sec'], \
+        "%.0f pages/s, baseline %d" % (best_pages, baseline['pages_per_sec'])
+
+def test_index_split(tmp_path):
+    source = tmp_path / 'src'
+    source.mkdir()
+    body = [ "goog.provide('goog');", "goog.provide('goog.array');",
+             "/** The goog namespace. */\nvar goog = {};",
+             "/** Arrays. */\ngoog.array = {};" ]
+    for i in range(30):
+        body.append("/** Function %d. */\ngoog.fn%d = function() {};" % (i, i))
+    for i in range(15):
+        body.append("/** Array %d. */\ngoog.array.a%d = function() {};"
+                    % (i, i))
+    (source / 'goog.js').write_text('\n'.join(body) + '\n')
+    for opts in [ ('--index-max-entries', '10'), ('--index-depth', '2') ]:
+        output = tmp_path / ('out' + opts[0])
+        run(*opts, '-o', str(output), str(source))
+        pages = sorted(path.name for path in output.glob('index-*.html'))
+        assert pages == [ 'index-goog.array.html', 'index-goog.html' ]
+        goog = (output / 'index-goog.html').read_text()
+        assert goog.count('<li><a href="goog.html#fn') == 30
+        assert 'goog.array.a0' not in goog